@@ -0,0 +1,30 @@
+import zipfile
+
+from wpgen.utils.file_handler import FileHandler
+
+
+def test_create_zip_prunes_excluded_and_hidden_paths(tmp_path):
+    theme = tmp_path / "my-theme"
+    for relative in (
+        "style.css",
+        "inc/setup.php",
+        "assets/js/main.js",
+        ".git/config",
+        "node_modules/pkg/index.js",
+        "inc/.cache/data",
+        "inc/__pycache__/x.pyc",
+        "assets/.DS_Store",
+        "Thumbs.db",
+        "tools/build.pyc",
+    ):
+        path = theme / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+    with FileHandler(temp_workspace=tmp_path / "work") as handler:
+        zip_path = handler.create_zip(str(theme))
+
+    with zipfile.ZipFile(zip_path) as archive:
+        names = sorted(archive.namelist())
+
+    assert names == ["assets/js/main.js", "inc/setup.php", "style.css"]
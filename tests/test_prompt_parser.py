@@ -0,0 +1,217 @@
+import importlib
+import re
+import sys
+
+from wpgen.llm.mock_provider import MockLLMProvider
+from wpgen.parsers import PromptParser, ThemeFeatures
+
+
+def _parser():
+    return PromptParser(MockLLMProvider())
+
+
+def test_feature_patterns_fall_back_to_stdlib_re(monkeypatch):
+    from wpgen.parsers import prompt_parser
+
+    original = dict(vars(prompt_parser))
+    monkeypatch.setitem(sys.modules, "re2", None)
+    try:
+        importlib.reload(prompt_parser)
+
+        assert prompt_parser._feature_re is re
+        assert [m.lastgroup for m in prompt_parser._FEATURE_RX.finditer("BLOG Photo SHOP")] == [
+            "BLOG",
+            "GALLERY",
+            "ECOMMERCE",
+        ]
+        assert prompt_parser._INTEGRATION_RX.search("WooCommerce").lastgroup == "ECOMMERCE"
+    finally:
+        # Put the original module objects back so ThemeFeatures identity is preserved
+        vars(prompt_parser).update(original)
+
+
+def test_validate_requirements_appends_missing_required_pages():
+    requirements = _parser()._validate_requirements({"pages": ["about", "index"]})
+
+    assert requirements["pages"] == ["about", "index", "single", "archive"]
+
+
+def test_extract_features_classifies_keywords_case_insensitively():
+    features = _parser().extract_features(
+        {
+            "features": ["Blog with Photo gallery", "Contact Form", "WooCommerce Shop"],
+            "integrations": [],
+        }
+    ).to_dict()
+
+    assert features["blog"] is True
+    assert features["gallery"] is True
+    assert features["contact_form"] is True
+    assert features["ecommerce"] is True
+    assert features["portfolio"] is False
+    assert features["widgets"] is True
+    assert features["customizer"] is True
+
+
+def test_extract_features_reads_integrations_and_post_types():
+    features = _parser().extract_features(
+        {"features": [], "post_types": ["project"], "integrations": ["woocommerce", "Contact 7"]}
+    ).to_dict()
+
+    assert features["ecommerce"] is True
+    assert features["contact_form"] is True
+    assert features["custom_post_types"] is True
+    assert features["blog"] is False
+
+
+def test_extract_features_returns_hashable_flags():
+    flags = _parser().extract_features({"features": ["portfolio"]})
+
+    assert flags == (
+        ThemeFeatures.PORTFOLIO | ThemeFeatures.WIDGETS | ThemeFeatures.CUSTOMIZER
+    )
+    assert {flags: "cached"}[flags] == "cached"
+    assert set(flags.to_dict()) == {
+        "blog",
+        "portfolio",
+        "contact_form",
+        "gallery",
+        "ecommerce",
+        "custom_post_types",
+        "widgets",
+        "customizer",
+    }
+
+
+class _StreamingMockProvider(MockLLMProvider):
+    def __init__(self, chunks):
+        super().__init__()
+        self.chunks = chunks
+        self.consumed = 0
+
+    def stream_analyze_prompt(self, prompt):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+
+def test_parse_stops_streaming_once_json_object_closes():
+    provider = _StreamingMockProvider(
+        [
+            "```json\n{\"theme_name\": \"Stream {Theme}\", ",
+            "\"features\": [\"blog\"], \"description\": \"Quote \\\" inside\"}",
+            "\n```\nHope this helps!",
+            "never read",
+        ]
+    )
+
+    requirements = PromptParser(provider).parse("A streaming blog")
+
+    assert requirements["theme_name"] == "stream-theme"
+    assert requirements["description"] == 'Quote " inside'
+    assert provider.consumed == 2
+
+
+def test_parse_falls_back_to_analyze_prompt_without_streaming():
+    provider = MockLLMProvider(responses={"plain": '{"theme_name": "plain-theme"}'})
+
+    requirements = PromptParser(provider).parse("A plain site")
+
+    assert requirements["theme_name"] == "plain-theme"
+
+
+def test_parse_multimodal_downscales_oversized_images():
+    import base64
+    import io
+
+    from PIL import Image
+
+    def _encode(size):
+        buffer = io.BytesIO()
+        Image.new("RGB", size, "#336699").save(buffer, format="PNG")
+        return {"data": base64.b64encode(buffer.getvalue()).decode(), "mime_type": "image/png"}
+
+    small = _encode((64, 32))
+    received = {}
+
+    class _Provider(MockLLMProvider):
+        def analyze_prompt_multimodal(self, prompt, images=None, additional_context=None):
+            received["images"] = images
+            return {"theme_name": "vision-theme"}
+
+    PromptParser(_Provider()).parse_multimodal("A site", images=[_encode((3200, 1600)), small])
+
+    large_out, small_out = received["images"]
+    with Image.open(io.BytesIO(base64.b64decode(large_out["data"]))) as img:
+        assert img.size == (1568, 784)
+    assert small_out is small
+
+
+def test_validate_requirements_normalizes_and_keeps_extra_keys():
+    requirements = _parser()._validate_requirements(
+        {"theme_name": "Shop Site", "typography": "serif", "features": "shop"}
+    )
+
+    assert requirements["theme_name"] == "shop-site"
+    assert requirements["features"] == ["shop"]
+    assert requirements["typography"] == "serif"
+    assert requirements["theme_display_name"] == "Shop Site"
+
+
+def test_anthropic_analysis_streams_description_in_user_turn():
+    from unittest.mock import MagicMock
+
+    from wpgen.llm.anthropic_provider import AnthropicProvider
+
+    provider = AnthropicProvider("test-key", {"model": "claude-test"})
+    provider.client = MagicMock()
+    stream = provider.client.messages.stream.return_value.__enter__.return_value
+    stream.text_stream = iter(['{"theme_name": "streamed"}'])
+
+    requirements = PromptParser(provider).parse("A bakery site")
+
+    kwargs = provider.client.messages.stream.call_args.kwargs
+    assert isinstance(kwargs["system"], str)
+    assert 'Description: "A bakery site"' in kwargs["messages"][0]["content"]
+    assert requirements["theme_name"] == "streamed"
+
+
+def test_parse_with_status_flags_fallback_spec():
+    class _BrokenProvider(MockLLMProvider):
+        def analyze_prompt(self, prompt):
+            raise RuntimeError("provider down")
+
+    requirements, parsed = PromptParser(_BrokenProvider()).parse_with_status("A bakery site")
+
+    assert parsed is False
+    assert requirements["theme_name"] == "wpgen-theme"
+    assert PromptParser(MockLLMProvider()).parse_with_status("A bakery site")[1] is True
+
+
+def test_parse_retries_without_streaming_when_stream_fails():
+    provider = _StreamingMockProvider(['{"theme_name": "cut off'])
+    provider.analyze_prompt = lambda prompt: {"theme_name": "recovered-theme"}
+
+    requirements, parsed = PromptParser(provider).parse_with_status("A flaky site")
+
+    assert parsed is True
+    assert requirements["theme_name"] == "recovered-theme"
+
+
+def test_openai_stream_requests_json_mode():
+    from unittest.mock import MagicMock
+
+    from wpgen.llm.openai_provider import OpenAIProvider
+
+    provider = OpenAIProvider("test-key", {"model": "gpt-test"})
+    provider.client = MagicMock()
+    chunk = MagicMock()
+    chunk.choices[0].delta.content = '{"theme_name": "json-mode"}'
+    provider.client.chat.completions.create.return_value.__enter__.return_value = iter([chunk])
+
+    requirements = PromptParser(provider).parse("A bakery site")
+
+    kwargs = provider.client.chat.completions.create.call_args.kwargs
+    assert kwargs["stream"] is True
+    assert kwargs["response_format"] == {"type": "json_object"}
+    assert requirements["theme_name"] == "json-mode"
@@ -0,0 +1,335 @@
+from unittest.mock import patch
+
+from wpgen.schema import get_default_theme_spec
+from wpgen.templates.renderer import JS_TEMPLATES, WORDPRESS_TEMPLATES, ThemeRenderer
+
+
+def test_renderer_compiles_templates_once(tmp_path):
+    renderer = ThemeRenderer(tmp_path)
+    spec = get_default_theme_spec()
+    spec.theme_name = "compiled-once"
+
+    with patch.object(renderer.php_env, "get_template") as php_get, \
+            patch.object(renderer.js_env, "get_template") as js_get:
+        theme_dir = renderer.render(spec)
+
+    php_get.assert_not_called()
+    js_get.assert_not_called()
+    for output_file in [*WORDPRESS_TEMPLATES, *JS_TEMPLATES]:
+        assert (tmp_path / "compiled-once" / output_file).is_file()
+    assert theme_dir == str(tmp_path / "compiled-once")
+
+
+def test_renderers_share_environments(tmp_path):
+    first = ThemeRenderer(tmp_path / "a")
+    second = ThemeRenderer(tmp_path / "b")
+
+    assert first.php_env is second.php_env
+    assert first.js_env is second.js_env
+    assert first.fallback_env is second.fallback_env
+    assert first._php_templates["index.php"] is second._php_templates["index.php"]
+
+
+def test_bytecode_cache_location_and_opt_out(tmp_path, monkeypatch):
+    from jinja2 import FileSystemBytecodeCache
+
+    from wpgen.templates.renderer import _make_bytecode_cache
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("WPGEN_JINJA_CACHE", raising=False)
+    monkeypatch.delenv("WPGEN_NO_BCC", raising=False)
+    cache = _make_bytecode_cache()
+    assert isinstance(cache, FileSystemBytecodeCache)
+    assert cache.directory == str(tmp_path / "wpgen" / "jinja")
+
+    monkeypatch.setenv("WPGEN_JINJA_CACHE", str(tmp_path / "custom"))
+    assert _make_bytecode_cache().directory == str(tmp_path / "custom")
+    assert not (tmp_path / "wpgen").exists()
+    assert not (tmp_path / "custom").exists()
+
+    monkeypatch.setenv("WPGEN_NO_BCC", "1")
+    assert _make_bytecode_cache() is None
+
+
+def test_bytecode_cache_creates_directory_on_first_compile(tmp_path, monkeypatch):
+    from jinja2 import DictLoader, Environment
+
+    from wpgen.templates.renderer import _make_bytecode_cache
+
+    monkeypatch.delenv("WPGEN_NO_BCC", raising=False)
+    monkeypatch.setenv("WPGEN_JINJA_CACHE", str(tmp_path / "jinja"))
+    cache = _make_bytecode_cache()
+    env = Environment(loader=DictLoader({"a.j2": "{{ x }}"}), bytecode_cache=cache)
+
+    assert env.get_template("a.j2").render(x=1) == "1"
+    assert list((tmp_path / "jinja").glob("*.cache"))
+
+    # An unusable location switches the cache off instead of breaking rendering
+    (tmp_path / "blocked").write_text("not a directory", encoding="utf-8")
+    monkeypatch.setenv("WPGEN_JINJA_CACHE", str(tmp_path / "blocked" / "jinja"))
+    env = Environment(loader=DictLoader({"a.j2": "{{ x }}"}), bytecode_cache=_make_bytecode_cache())
+
+    assert env.get_template("a.j2").render(x=2) == "2"
+
+
+def test_sanitizers_normalize_names():
+    from wpgen.templates.renderer import sanitize_filename, sanitize_theme_slug
+
+    assert sanitize_filename("Front Page_Template!.php") == "front-page-template.php"
+    assert sanitize_theme_slug("  My__Cool Theme!! ") == "my-cool-theme"
+    assert sanitize_theme_slug("!!!") == "wpgen-theme"
+
+
+def test_validate_php_files_lints_batch_in_one_call(tmp_path, monkeypatch):
+    import subprocess
+
+    from wpgen.templates import renderer
+
+    good, bad = tmp_path / "good.php", tmp_path / "bad.php"
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        stdout = f"No syntax errors detected in {good}\nErrors parsing {bad}\n"
+        return subprocess.CompletedProcess(cmd, 255, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(renderer, "_php_supports_multi_lint", lambda: True)
+    monkeypatch.setattr(renderer.subprocess, "run", fake_run)
+
+    assert renderer.validate_php_files([good, bad]) == {good: True, bad: False}
+    assert calls == [["php", "-l", str(good), str(bad)]]
+
+
+def test_render_falls_back_for_templates_failing_batch_validation(tmp_path, monkeypatch):
+    from wpgen.templates import renderer
+
+    batches = []
+
+    def fake_validate(paths):
+        batches.append([path.name for path in paths])
+        if len(batches) == 1:
+            return {path: path.name not in ("index.php", "page.php") for path in paths}
+        return dict.fromkeys(paths, True)
+
+    monkeypatch.setattr(renderer, "validate_php_files", fake_validate)
+
+    spec = get_default_theme_spec()
+    spec.theme_name = "batch-fallback"
+    theme_dir = ThemeRenderer(tmp_path).render(spec)
+
+    expected = renderer._FALLBACK_ENV.get_template("index.php.j2").render(
+        ThemeRenderer(tmp_path)._prepare_context(spec)
+    )
+    assert (tmp_path / "batch-fallback" / "index.php").read_text(encoding="utf-8") == expected
+    assert theme_dir.endswith("batch-fallback")
+    assert batches[1] == ["index.php", "page.php"]
+
+
+def test_render_reports_template_failures_from_worker_threads(tmp_path, monkeypatch):
+    import pytest
+    from jinja2 import Template
+
+    renderer = ThemeRenderer(tmp_path)
+    monkeypatch.setitem(renderer._php_templates, "single.php", Template("{{ missing.attr }}"))
+    spec = get_default_theme_spec()
+    spec.theme_name = "broken"
+
+    with pytest.raises(ValueError, match="single.php"):
+        renderer.render(spec)
+
+
+def test_write_bytes_fast_replaces_existing_content(tmp_path):
+    from wpgen.templates.renderer import _write_bytes_fast
+
+    target = tmp_path / "README.md"
+    target.write_bytes(b"old content that is longer")
+    _write_bytes_fast(target, "new ✓\n".encode("utf-8"))
+
+    assert target.read_bytes() == "new ✓\n".encode("utf-8")
+
+
+def test_theme_dirs_are_created_once_and_recreated_if_removed(tmp_path):
+    import shutil
+
+    renderer = ThemeRenderer(tmp_path)
+    theme_dir = tmp_path / "dirs"
+
+    renderer._ensure_theme_dirs(theme_dir)
+    assert (theme_dir / "assets" / "css").is_dir()
+    assert (theme_dir / "template-parts").is_dir()
+
+    with patch("pathlib.Path.mkdir") as mkdir:
+        renderer._ensure_theme_dirs(theme_dir)
+    mkdir.assert_not_called()
+
+    shutil.rmtree(theme_dir)
+    renderer._ensure_theme_dirs(theme_dir)
+    assert (theme_dir / "assets" / "images").is_dir()
+
+
+def test_screenshot_fonts_are_loaded_once(tmp_path):
+    from wpgen.templates import renderer
+
+    renderer._load_font.cache_clear()
+    for name in ("first", "second"):
+        renderer._placeholder_png.cache_clear()
+        spec = get_default_theme_spec()
+        spec.theme_name = name
+        ThemeRenderer(tmp_path).render(spec)
+
+    assert renderer._load_font.cache_info().misses == 4
+    assert renderer._load_font.cache_info().hits == 4
+
+
+def test_identical_placeholder_screenshots_are_drawn_once(tmp_path):
+    from wpgen.templates import renderer
+
+    renderer._placeholder_png.cache_clear()
+    for name in ("first", "second"):
+        spec = get_default_theme_spec()
+        spec.theme_name = name
+        ThemeRenderer(tmp_path).render(spec)
+
+    assert renderer._placeholder_png.cache_info().misses == 1
+    assert (tmp_path / "first" / "screenshot.png").read_bytes() == (
+        tmp_path / "second" / "screenshot.png"
+    ).read_bytes()
+
+
+def test_screenshot_from_uploaded_image_is_fitted_to_canvas(tmp_path):
+    from PIL import Image
+
+    source = tmp_path / "mockup.png"
+    Image.new("RGB", (4000, 1500), (200, 30, 30)).save(source)
+    spec = get_default_theme_spec()
+    spec.theme_name = "from-upload"
+
+    ThemeRenderer(tmp_path).render(spec, images=[{"path": str(source)}])
+
+    with Image.open(tmp_path / "from-upload" / "screenshot.png") as shot:
+        assert shot.size == (1200, 900)
+        assert shot.convert("RGB").getpixel((600, 450)) == (200, 30, 30)
+        assert shot.convert("RGB").getpixel((600, 10)) == (247, 248, 250)
+
+
+def test_existing_screenshot_is_kept_and_failed_screenshot_leaves_no_file(tmp_path, monkeypatch):
+    from wpgen.templates import renderer as renderer_module
+
+    renderer = ThemeRenderer(tmp_path)
+    spec = get_default_theme_spec()
+    theme_dir = tmp_path / "shots"
+    theme_dir.mkdir()
+
+    (theme_dir / "screenshot.png").write_bytes(b"custom")
+    renderer._generate_screenshot(theme_dir, spec, None)
+    assert (theme_dir / "screenshot.png").read_bytes() == b"custom"
+
+    (theme_dir / "screenshot.png").unlink()
+    monkeypatch.setattr(renderer_module, "Image", None)
+    renderer._generate_screenshot(theme_dir, spec, None)
+    assert not (theme_dir / "screenshot.png").exists()
+
+
+def test_prepare_context_exposes_spec_models_without_dumping(tmp_path):
+    from wpgen.schema import ThemeSpecification
+
+    spec = get_default_theme_spec()
+    spec.theme_name = "no-dump"
+
+    with patch.object(ThemeSpecification, "model_dump", side_effect=AssertionError("dumped")):
+        context = ThemeRenderer(tmp_path)._prepare_context(spec)
+        ThemeRenderer(tmp_path).render(spec)
+
+    assert context["theme"] is spec
+    assert context["colors"] is spec.colors
+
+
+def test_php_lint_results_are_cached_by_content(tmp_path, monkeypatch):
+    import subprocess
+
+    from wpgen.templates import renderer
+
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(renderer, "_PHP_LINT_CACHE", {})
+    monkeypatch.setattr(renderer.subprocess, "run", fake_run)
+
+    first, copy = tmp_path / "a.php", tmp_path / "b.php"
+    first.write_text("<?php echo 1;", encoding="utf-8")
+    copy.write_text("<?php echo 1;", encoding="utf-8")
+
+    assert renderer.validate_php_file(first) is True
+    assert renderer.validate_php_files([copy]) == {copy: True}
+    assert len(calls) == 1
+
+    first.write_text("<?php echo 2;", encoding="utf-8")
+    renderer.validate_php_file(first)
+    assert len(calls) == 2
+
+
+def test_additional_files_include_feature_lines(tmp_path):
+    spec = get_default_theme_spec()
+    spec.theme_name = "extras"
+    spec.features.dark_mode = True
+
+    ThemeRenderer(tmp_path).render(spec)
+
+    theme_dir = tmp_path / "extras"
+    readme = (theme_dir / "README.md").read_text(encoding="utf-8")
+    assert readme.startswith(f"# {spec.theme_display_name}\n")
+    assert "- Navigation menus\n- Dark mode support\n\n## Credits" in readme
+    assert "WooCommerce" not in readme
+    assert (theme_dir / ".gitignore").read_bytes().startswith(b"# IDE\n")
+    assert (theme_dir / "assets" / "css" / "editor-style.css").is_file()
+
+
+def test_placeholder_falls_back_for_malformed_colors(tmp_path):
+    from PIL import Image
+
+    spec = get_default_theme_spec()
+    spec.theme_name = "bad-colors"
+    spec.colors.background = "#zz zz"
+    spec.colors.accent = "#12 45 "
+
+    ThemeRenderer(tmp_path).render(spec)
+
+    with Image.open(tmp_path / "bad-colors" / "screenshot.png") as shot:
+        assert shot.convert("RGB").getpixel((50, 850)) == (248, 250, 252)
+
+
+def test_hex_to_rgb_returns_none_for_invalid_colors():
+    from wpgen.templates import renderer
+
+    renderer._hex_to_rgb.cache_clear()
+
+    assert renderer._hex_to_rgb("#1a1a2e") == (26, 26, 46)
+    assert renderer._hex_to_rgb("#1a1a2e") == (26, 26, 46)
+    assert renderer._hex_to_rgb("#zz zz") is None
+    assert renderer._hex_to_rgb(None) is None
+    assert renderer._hex_to_rgb("1a1a2e") is None
+    assert renderer._hex_to_rgb.cache_info().hits == 1
+
+
+def test_render_does_not_mutate_spec_theme_name(tmp_path):
+    spec = get_default_theme_spec()
+    spec.theme_name = "My Cool_Theme!"
+
+    theme_dir = ThemeRenderer(tmp_path).render(spec)
+
+    assert spec.theme_name == "My Cool_Theme!"
+    assert theme_dir == str(tmp_path / "my-cool-theme")
+    style_css = (tmp_path / "my-cool-theme" / "style.css").read_text(encoding="utf-8")
+    assert "Text Domain: my-cool-theme" in style_css
+
+
+def test_shared_environments_do_not_recheck_template_sources(tmp_path):
+    renderer = ThemeRenderer(tmp_path)
+
+    assert renderer.php_env.auto_reload is False
+    with patch("os.path.getmtime") as getmtime:
+        renderer.php_env.get_template("index.php.j2")
+    getmtime.assert_not_called()
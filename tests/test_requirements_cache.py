@@ -0,0 +1,129 @@
+import time
+
+from wpgen.service import ThemeGenerationService
+from wpgen.utils.requirements_cache import RequirementsCache
+
+
+class _CountingParser:
+    def __init__(self, parsed=True):
+        self.calls = 0
+        self.parsed = parsed
+
+    def parse(self, prompt):
+        return self.parse_with_status(prompt)[0]
+
+    def parse_with_status(self, prompt):
+        self.calls += 1
+        return {"theme_name": "cached-theme", "features": ["blog"], "prompt": prompt}, self.parsed
+
+
+def test_requirements_cache_round_trip_and_expiry(tmp_path):
+    cache = RequirementsCache(tmp_path / "cache.db", ttl_seconds=60)
+    key = RequirementsCache.make_key("openai", "gpt-4", "A blog")
+
+    assert cache.get(key) is None
+    cache.set(key, {"theme_name": "blog", "pages": ["index"]})
+    assert cache.get(key) == {"theme_name": "blog", "pages": ["index"]}
+    assert RequirementsCache.make_key("openai", "gpt-4o", "A blog") != key
+
+    cache._conn.execute("UPDATE cache SET ts = ?", (int(time.time()) - 120,))
+    assert cache.get(key) is None
+
+
+def test_service_reuses_cached_requirements_when_enabled(tmp_path):
+    cfg = {
+        "llm": {"provider": "openai", "openai": {"model": "gpt-4"}},
+        "cache": {"enabled": True, "path": str(tmp_path / "req.db")},
+    }
+    service = ThemeGenerationService(cfg)
+    parser = _CountingParser()
+
+    first = service._parse_requirements(parser, "A photography portfolio", cfg, "openai")
+    second = service._parse_requirements(parser, "A photography portfolio", cfg, "openai")
+
+    assert parser.calls == 1
+    assert second == first
+    assert second is not first
+
+
+def test_service_does_not_cache_fallback_requirements(tmp_path):
+    cfg = {
+        "llm": {"provider": "openai", "openai": {"model": "gpt-4"}},
+        "cache": {"enabled": True, "path": str(tmp_path / "req.db")},
+    }
+    service = ThemeGenerationService(cfg)
+    parser = _CountingParser(parsed=False)
+
+    service._parse_requirements(parser, "A photography portfolio", cfg, "openai")
+    service._parse_requirements(parser, "A photography portfolio", cfg, "openai")
+
+    assert parser.calls == 2
+
+
+def test_service_skips_cache_when_disabled(tmp_path):
+    cfg = {"llm": {"provider": "openai"}, "output": {"output_dir": str(tmp_path)}}
+    service = ThemeGenerationService(cfg)
+    parser = _CountingParser()
+
+    service._parse_requirements(parser, "A photography portfolio", cfg, "openai")
+    service._parse_requirements(parser, "A photography portfolio", cfg, "openai")
+
+    assert parser.calls == 2
+    assert not (tmp_path / "requirements.cache.db").exists()
+
+
+def _keyword_encoder(texts):
+    vocabulary = ["streetwear", "fashion", "urban", "bakery", "bread"]
+    return [[float(word in text.lower()) for word in vocabulary] for text in texts]
+
+
+def test_semantic_cache_matches_similar_prompts_only(tmp_path):
+    from wpgen.utils.semantic_cache import SemanticRequirementsCache
+
+    cache = SemanticRequirementsCache(
+        tmp_path / "cache.db", threshold=0.8, encoder=_keyword_encoder
+    )
+    cache.set("openai|gpt-4", cache.embed("streetwear fashion urban"), {"theme_name": "street"})
+
+    assert cache.get("openai|gpt-4", cache.embed("urban streetwear fashion store")) == {
+        "theme_name": "street"
+    }
+    assert cache.get("openai|gpt-4", cache.embed("artisan bakery bread")) is None
+    assert cache.get("anthropic|claude", cache.embed("streetwear fashion urban")) is None
+
+
+def test_service_semantic_cache_respects_temperature_guard(tmp_path, monkeypatch):
+    from wpgen.utils import semantic_cache
+
+    monkeypatch.setattr(semantic_cache, "_load_default_encoder", lambda: _keyword_encoder)
+    cfg = {
+        "llm": {"provider": "openai", "openai": {"model": "gpt-4", "temperature": 0.2}},
+        "cache": {"enabled": True, "semantic": True, "path": str(tmp_path / "req.db")},
+    }
+    service = ThemeGenerationService(cfg)
+    parser = _CountingParser()
+
+    service._parse_requirements(parser, "streetwear fashion urban site", cfg, "openai")
+    service._parse_requirements(parser, "urban fashion streetwear shop", cfg, "openai")
+    assert parser.calls == 1
+
+    cfg["llm"]["openai"]["temperature"] = 0.9
+    service._parse_requirements(parser, "fashion streetwear urban brand", cfg, "openai")
+    assert parser.calls == 2
+
+
+def test_service_semantic_cache_skips_fallback_requirements(tmp_path, monkeypatch):
+    from wpgen.utils import semantic_cache
+
+    monkeypatch.setattr(semantic_cache, "_load_default_encoder", lambda: _keyword_encoder)
+    cfg = {
+        "llm": {"provider": "openai", "openai": {"model": "gpt-4", "temperature": 0.2}},
+        "cache": {"enabled": True, "semantic": True, "path": str(tmp_path / "req.db")},
+    }
+    service = ThemeGenerationService(cfg)
+    parser = _CountingParser(parsed=False)
+
+    service._parse_requirements(parser, "streetwear fashion urban site", cfg, "openai")
+    service._parse_requirements(parser, "urban fashion streetwear shop", cfg, "openai")
+
+    assert parser.calls == 2
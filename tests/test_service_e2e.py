@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from wpgen.schema import get_default_theme_spec
 from wpgen.service import (
     GenerationRequest,
     GenerationResult,
@@ -12,6 +13,16 @@ from wpgen.service import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_provider_cache(monkeypatch):
+    """Keep providers cached at module level from leaking between tests."""
+    from collections import OrderedDict
+
+    from wpgen import service as service_module
+
+    monkeypatch.setattr(service_module, "_PROVIDERS", OrderedDict())
+
+
 @pytest.fixture
 def mock_config():
     """Fixture providing test configuration."""
@@ -53,6 +64,11 @@ def mock_llm_provider():
         }
 
     provider.generate.side_effect = mock_generate
+    # The hybrid generator sends prompt blocks and parses a raw JSON spec back
+    spec = get_default_theme_spec()
+    spec.theme_name = "test-theme"
+    spec.theme_display_name = "Test Theme"
+    provider.generate_from_blocks.return_value = spec.model_dump_json()
     return provider
 
 
@@ -262,3 +278,209 @@ def test_service_handles_exception_gracefully(mock_config):
         assert result.success is False
         assert result.error is not None
         assert "LLM initialization failed" in result.error
+        assert result.error_details == "Exception: LLM initialization failed\n"
+
+
+def test_enhance_prompt_keeps_image_order_and_skips_failures(mock_config, tmp_path):
+    """Test parallel image analysis preserves order and isolates failures."""
+    import time
+
+    paths = []
+    for name, delay in (("slow", 0.05), ("broken", 0), ("fast", 0)):
+        image = tmp_path / f"{name}.png"
+        image.write_bytes(b"")
+        paths.append((str(image), name, delay))
+
+    class FakeAnalyzer:
+        def __init__(self, llm_provider):
+            pass
+
+        def analyze_design_mockup(self, image_path):
+            _, name, delay = next(p for p in paths if p[0] == image_path)
+            if name == "broken":
+                raise ValueError("unreadable image")
+            time.sleep(delay)
+            return f"analysis of {name}"
+
+    request = GenerationRequest(
+        prompt="Create a fashion theme",
+        image_files=[p[0] for p in paths] + [str(tmp_path / "missing.png")],
+    )
+
+    with patch("wpgen.service.ImageAnalyzer", FakeAnalyzer):
+        prompt = ThemeGenerationService(mock_config)._enhance_prompt(request, Mock())
+
+    assert prompt == (
+        "Create a fashion theme"
+        "\n\nDesign Analysis:\nanalysis of slow"
+        "\n\nDesign Analysis:\nanalysis of fast"
+    )
+
+
+def test_publish_theme_overlaps_github_push_and_wordpress_deploy(mock_config):
+    """Test GitHub push and WordPress deploy run concurrently when both are requested."""
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+    service = ThemeGenerationService(mock_config)
+
+    def push(*args):
+        barrier.wait()
+        return {"success": True, "url": "https://github.com/user/repo"}
+
+    def deploy(*args):
+        barrier.wait()
+        return {"success": True, "deployed": True}
+
+    request = GenerationRequest(
+        prompt="Create a theme", push_to_github=True, deploy_to_wordpress=True
+    )
+    with patch.object(service, "_push_to_github", side_effect=push), \
+            patch.object(service, "_deploy_to_wordpress", side_effect=deploy):
+        github_result, wp_result = service._publish_theme("theme", request, {}, mock_config)
+
+    assert github_result["url"] == "https://github.com/user/repo"
+    assert wp_result["deployed"] is True
+
+
+def test_apply_request_overrides_does_not_mutate_service_config():
+    """Test per-request LLM overrides are applied to a copy of the config."""
+    config = {
+        "llm": {"provider": "local-ollama", "local-ollama": {"brains_model": "llama3"}},
+        "output": {"output_dir": "output"},
+    }
+    service = ThemeGenerationService(config)
+
+    cfg = service._apply_request_overrides(
+        GenerationRequest(
+            prompt="Create a theme",
+            llm_model="custom-model",
+            llm_brains_model="qwen2",
+            llm_vision_base_url="http://vision:1234/v1",
+        )
+    )
+
+    assert cfg["llm"]["model"] == "custom-model"
+    assert cfg["llm"]["local-ollama"] == {
+        "brains_model": "qwen2",
+        "vision_base_url": "http://vision:1234/v1",
+    }
+    assert cfg["output"] is config["output"]
+    assert config["llm"] == {
+        "provider": "local-ollama",
+        "local-ollama": {"brains_model": "llama3"},
+    }
+
+
+def test_deploy_to_wordpress_reuses_recent_connection_probe(mock_config, monkeypatch):
+    """Test repeat deploys to the same site skip the connection test within the TTL."""
+    from wpgen import service as service_module
+
+    for name in ("WP_SITE_URL", "WP_USERNAME", "WP_APP_PASSWORD"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(service_module, "_WP_PROBES", {})
+    cfg = dict(mock_config, wordpress_api={
+        "site_url": "https://example.com", "username": "admin", "app_password": "secret",
+    })
+    request = GenerationRequest(prompt="Create a theme", wordpress_activate=False)
+
+    def deploy():
+        # A fresh service per call, as generate_theme() builds one per request
+        service = ThemeGenerationService(cfg)
+        return service._deploy_to_wordpress("theme", request, {"theme_name": "t"}, cfg)
+
+    # autospec rejects calls to methods WordPressAPI does not have
+    with patch("wpgen.service.WordPressAPI", autospec=True) as MockWordPressAPI:
+        wp_api = MockWordPressAPI.return_value
+        wp_api.deploy_theme.return_value = {
+            "success": True, "theme_name": "t", "zip_path": "t.zip", "instructions": [],
+        }
+
+        first = deploy()
+        second = deploy()
+        assert wp_api.test_connection.call_count == 1
+
+        wp_api.deploy_theme.side_effect = RuntimeError("packaging failed")
+        failed = deploy()
+        deploy()
+
+    assert first["success"] is True and second["success"] is True
+    assert first["theme_id"] == "t" and first["zip_path"] == "t.zip"
+    assert failed["success"] is False
+    assert wp_api.test_connection.call_count == 2
+    wp_api.deploy_theme.assert_called_with("theme")
+
+
+def test_service_reuses_llm_provider_for_same_llm_config(mock_config, monkeypatch):
+    """Test providers are shared across services and bounded in number."""
+    from wpgen import service as service_module
+
+    monkeypatch.setattr(service_module, "_PROVIDER_CACHE_SIZE", 2)
+
+    def provider_for(**overrides):
+        # A fresh service per call, as generate_theme() builds one per request
+        service = ThemeGenerationService(mock_config)
+        request = GenerationRequest(prompt="Create a theme", **overrides)
+        cfg = service._apply_request_overrides(request)
+        return service._get_llm_provider(cfg)
+
+    with patch("wpgen.service.get_llm_provider", side_effect=lambda cfg: object()) as mock_get:
+        first = provider_for()
+        second = provider_for()
+        other = provider_for(llm_model="gpt-4o")
+        provider_for(llm_model="gpt-4o-mini")
+        evicted = provider_for()
+
+    assert first is second
+    assert other is not first
+    assert evicted is not first
+    assert mock_get.call_count == 4
+    assert all(len(key) == 64 and "gpt" not in key for key in service_module._PROVIDERS)
+
+
+def test_existing_paths_lists_each_parent_once(tmp_path, monkeypatch):
+    """Test batched existence checks match Path.exists() for absolute and relative paths."""
+    import os
+
+    from wpgen.service import _existing_paths, _path_key
+
+    (tmp_path / "a.png").write_bytes(b"")
+    (tmp_path / "b.md").write_text("doc")
+    monkeypatch.chdir(tmp_path)
+
+    scanned = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda d: scanned.append(d) or real_scandir(d))
+
+    paths = [str(tmp_path / "a.png"), str(tmp_path / "missing.png"), "b.md", "nope/x.md"]
+    existing = _existing_paths(paths)
+
+    assert [p for p in paths if _path_key(p) in existing] == [str(tmp_path / "a.png"), "b.md"]
+    assert sorted(scanned) == sorted([str(tmp_path), ".", "nope"])
+
+
+def test_validate_theme_probes_for_php_once_per_strictness(mock_config, minimal_theme_structure):
+    """Test validators (and their php --version probe) are reused across validations."""
+    from wpgen.service import _shared_validator
+
+    _shared_validator.cache_clear()
+    service = ThemeGenerationService(mock_config)
+
+    with patch("subprocess.run", side_effect=FileNotFoundError("php not found")) as mock_run:
+        service._validate_theme(str(minimal_theme_structure), strict=False)
+        service._validate_theme(str(minimal_theme_structure), strict=False)
+        probes = [c for c in mock_run.call_args_list if "--version" in c.args[0]]
+
+    _shared_validator.cache_clear()
+    assert len(probes) == 2
+
+
+def test_generation_request_strips_prompt_whitespace():
+    """Test prompts are stripped and whitespace-only prompts are rejected."""
+    from pydantic import ValidationError
+
+    request = GenerationRequest(prompt="   Create a blog theme  \n")
+    assert request.prompt == "Create a blog theme"
+
+    with pytest.raises(ValidationError):
+        GenerationRequest(prompt="            ")
@@ -0,0 +1,15 @@
+from wpgen.utils.text_utils import TextProcessor
+
+
+def test_extract_text_stops_at_character_budget(tmp_path):
+    notes = tmp_path / "notes.md"
+    notes.write_text("# Brief\n" + "é" * 5000, encoding="utf-8")
+    plain = tmp_path / "notes.txt"
+    plain.write_text("short", encoding="utf-8")
+
+    processor = TextProcessor()
+
+    assert processor.extract_text(str(notes), max_chars=100) == ("# Brief\n" + "é" * 92)
+    assert len(processor.extract_text(str(notes))) == 5008
+    assert processor.extract_text(str(plain), max_chars=2000) == "short"
+    assert processor.extract_text(str(tmp_path / "missing.txt"), max_chars=10) == ""
@@ -1,4 +1,4 @@
-from wpgen.prompts.theme_prompts import get_theme_spec_prompt
+from wpgen.prompts.theme_prompts import SCHEMA_DESCRIPTION, get_theme_spec_prompt
 
 
 def test_theme_prompt_includes_inspiration_and_trends_with_design_profile():
@@ -9,7 +9,11 @@ def test_theme_prompt_includes_inspiration_and_trends_with_design_profile():
 
     assert "DESIGN INSPIRATION" in prompt
     assert "MODERN DESIGN TRENDS" in prompt
-    assert prompt.index("MODERN DESIGN TRENDS") < prompt.index("## Theme Specification")
+    assert (
+        prompt.index("## Theme Specification")
+        < prompt.index("MODERN DESIGN TRENDS")
+        < prompt.index("USER REQUEST")
+    )
 
 
 def test_theme_prompt_includes_ecommerce_guidance_for_woocommerce():
@@ -20,4 +24,186 @@ def test_theme_prompt_includes_ecommerce_guidance_for_woocommerce():
 
     assert "ECOMMERCE THEME BEST PRACTICES" in prompt
     assert "MODERN DESIGN TRENDS" in prompt
-    assert prompt.index("ECOMMERCE THEME BEST PRACTICES") < prompt.index("## Theme Specification")
+    assert (
+        prompt.index("## Theme Specification")
+        < prompt.index("ECOMMERCE THEME BEST PRACTICES")
+        < prompt.index("USER REQUEST")
+    )
+
+
+def test_parse_llm_json_response_fixes_trailing_commas():
+    from wpgen.prompts import parse_llm_json_response
+
+    success, spec, errors = parse_llm_json_response(
+        '{"theme_name": "comma-theme", "theme_display_name": "Comma Theme",}',
+        fallback_to_defaults=False,
+    )
+
+    assert success is True
+    assert spec.theme_name == "comma-theme"
+    assert "Fixed JSON syntax issues" in errors
+
+
+def test_clean_json_response_keeps_deeply_nested_objects_whole():
+    from wpgen.prompts.theme_prompts import _clean_json_response
+
+    response = (
+        'Here is the spec: {"features": {"woocommerce": {"enabled": true}}, '
+        '"description": "Braces } and \\" quotes"} Let me know!'
+    )
+
+    assert _clean_json_response(response) == (
+        '{"features": {"woocommerce": {"enabled": true}}, '
+        '"description": "Braces } and \\" quotes"}'
+    )
+
+
+def test_clean_json_response_returns_bare_and_fenced_objects_directly():
+    from wpgen.prompts.theme_prompts import _clean_json_response
+
+    assert _clean_json_response('  {"theme_name": "bare"}\n') == '{"theme_name": "bare"}'
+    assert _clean_json_response('```json\n{"theme_name": "fenced"}\n```') == (
+        '{"theme_name": "fenced"}'
+    )
+
+
+def test_parse_llm_json_response_fallback_returns_independent_default_copies():
+    from wpgen.prompts import parse_llm_json_response
+
+    _, first, _ = parse_llm_json_response("no json here")
+    first.theme_name = "mutated"
+    _, second, _ = parse_llm_json_response("still no json")
+
+    assert second.theme_name == "wpgen-theme"
+
+
+def test_theme_prompt_starts_with_schema_and_ends_with_user_request():
+    first = get_theme_spec_prompt("A bakery site")
+    second = get_theme_spec_prompt("A law firm site", dark_mode_enabled=True)
+
+    assert first.startswith(SCHEMA_DESCRIPTION)
+    assert second.startswith(SCHEMA_DESCRIPTION)
+    assert first.rstrip().endswith("Output ONLY the JSON, nothing else.")
+    assert first.index("USER REQUEST: A bakery site") > first.index("## Theme Specification")
+
+
+def test_theme_spec_messages_mark_static_blocks_cacheable():
+    from wpgen.prompts import get_theme_spec_messages
+
+    kwargs = {"woocommerce_enabled": True, "image_analysis": "Dark hero image"}
+    blocks = get_theme_spec_messages("Set up a modern shop", **kwargs)
+
+    assert [("cache_control" in block) for block in blocks] == [True, True, False]
+    assert blocks[0]["text"] == SCHEMA_DESCRIPTION
+    assert "USER REQUEST: Set up a modern shop" in blocks[-1]["text"]
+    assert "\n\n".join(b["text"] for b in blocks) == get_theme_spec_prompt(
+        "Set up a modern shop", **kwargs
+    )
+
+
+def test_design_guidance_helpers_are_memoised():
+    from wpgen.design_inspiration import get_inspiration_context, get_modern_design_trends
+
+    get_theme_spec_prompt("warm up", design_profile={"name": "streetwear_modern"})
+    trends_hits = get_modern_design_trends.cache_info().hits
+    context_hits = get_inspiration_context.cache_info().hits
+
+    get_theme_spec_prompt("second call", design_profile={"name": "streetwear_modern"})
+
+    assert get_modern_design_trends.cache_info().hits == trends_hits + 1
+    assert get_inspiration_context.cache_info().hits == context_hits + 1
+
+
+def test_extract_theme_requirements_copies_all_colors():
+    from wpgen.prompts.theme_prompts import extract_theme_requirements_from_json
+    from wpgen.schema import get_default_theme_spec
+
+    spec = get_default_theme_spec()
+    requirements = extract_theme_requirements_from_json(spec)
+
+    assert requirements["design_profile"]["colors"] == spec.colors.model_dump()
+    assert requirements["color_scheme"] == spec.colors.primary
+
+
+def test_parse_llm_json_response_skips_repair_for_unfixable_errors(monkeypatch):
+    from wpgen.prompts import theme_prompts
+
+    calls = []
+    monkeypatch.setattr(theme_prompts, "_try_fix_json", lambda text: calls.append(text))
+
+    success, spec, errors = theme_prompts.parse_llm_json_response(
+        '{"theme_name": "tab\there"}', fallback_to_defaults=False
+    )
+
+    assert success is False
+    assert spec is None
+    assert calls == []
+
+
+def test_parse_llm_json_response_clean_json_skips_dict_route(monkeypatch):
+    from wpgen.prompts import theme_prompts
+
+    def _unexpected(*args, **kwargs):
+        raise AssertionError("dict route should not run for valid JSON")
+
+    monkeypatch.setattr(theme_prompts, "_json_loads", _unexpected)
+
+    success, spec, errors = theme_prompts.parse_llm_json_response(
+        '{"theme_name": "fast-theme", "theme_display_name": "Fast Theme"}'
+    )
+
+    assert success is True
+    assert spec.theme_name == "fast-theme"
+    assert errors == []
+
+
+def test_clean_json_response_strips_fence_with_surrounding_text():
+    from wpgen.prompts.theme_prompts import _clean_json_response
+
+    response = 'Here you go:\n```\n{"theme_name": "plain-fence"}\n```\nEnjoy!'
+
+    assert _clean_json_response(response) == '{"theme_name": "plain-fence"}'
+    assert _clean_json_response('```json\n{"a": 1}') == '{"a": 1}'
+
+
+def test_parse_llm_json_response_caches_repeated_responses(monkeypatch):
+    from wpgen.prompts import theme_prompts
+
+    response = 'Sure!\n{"theme_name": "cached-theme", "theme_display_name": "Cached",}'
+    first = theme_prompts.parse_llm_json_response(response)
+
+    def _unexpected(*args, **kwargs):
+        raise AssertionError("repeated response should be served from cache")
+
+    monkeypatch.setattr(theme_prompts, "_clean_json_response", _unexpected)
+    second = theme_prompts.parse_llm_json_response(response)
+
+    assert second[0] is True
+    assert second[1].theme_name == "cached-theme"
+    assert second[2] == first[2]
+    assert second[1] is not first[1]
+    second[2].append("mutated")
+    assert theme_prompts.parse_llm_json_response(response)[2] == first[2]
+
+
+def test_clean_json_response_returns_none_without_balanced_object():
+    from wpgen.prompts.theme_prompts import _clean_json_response
+
+    assert _clean_json_response('Result: {"theme_name": "cut-off"') is None
+    assert _clean_json_response('no json } here {') is None
+
+
+def test_parse_llm_json_response_logs_phase_timings_when_slow(monkeypatch):
+    from wpgen.prompts import theme_prompts
+
+    logged = []
+    monkeypatch.setattr(theme_prompts, "_SLOW_PARSE_MS", -1)
+    monkeypatch.setattr(
+        theme_prompts.logger, "info", lambda message, extra=None: logged.append(extra)
+    )
+
+    theme_prompts.parse_llm_json_response('{"theme_name": "timed-theme",}')
+
+    assert len(logged) == 1
+    assert {"clean", "validate_json", "loads", "fix", "validate"} <= set(logged[0]["parse_phases"])
+    assert logged[0]["response_chars"] == len('{"theme_name": "timed-theme",}')
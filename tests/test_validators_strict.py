@@ -183,3 +183,31 @@ def test_validation_summary_strict_mode(tmp_path, capsys):
 
     assert "ERROR" in output  # Warnings shown as errors in strict mode
     assert "Strict mode" in output or "strict" in output.lower()
+
+
+def test_combined_validator_reads_each_php_file_once(tmp_path, monkeypatch):
+    """Test the combined validator shares one read of each file between validators."""
+    from wpgen.utils.combined_validator import validate_directory
+
+    (tmp_path / "style.css").write_text("/* Theme Name: Test */")
+    (tmp_path / "index.php").write_text("<?php get_header();")
+    (tmp_path / "parts").mkdir()
+    (tmp_path / "parts" / "bad.php").write_text("```php\n<?php echo 1;")
+
+    reads = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self.name)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    with patch("subprocess.run", side_effect=FileNotFoundError("php not found")):
+        results = validate_directory(tmp_path, strict=True)
+
+    assert sorted(reads) == ["bad.php", "index.php"]
+    assert results["code"]["files_checked"] == 2
+    assert results["theme"]["php_files"] == 2
+    assert any("Contains markdown code blocks" in e for e in results["errors"])
+    assert any("Missing recommended file: functions.php" in w for w in results["warnings"])
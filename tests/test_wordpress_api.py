@@ -0,0 +1,37 @@
+from unittest.mock import patch
+
+from wpgen.wordpress.wordpress_api import WordPressAPI
+
+
+def test_upload_media_streams_file_body(tmp_path):
+    archive = tmp_path / "theme.zip"
+    archive.write_bytes(b"PK" + b"\0" * 1024)
+    api = WordPressAPI("https://example.com/", "admin", "secret")
+
+    with patch("wpgen.wordpress.wordpress_api.requests.post") as mock_post:
+        mock_post.return_value.json.return_value = {"id": 7, "source_url": "https://example.com/theme.zip"}
+        result = api.upload_media(str(archive))
+
+    kwargs = mock_post.call_args.kwargs
+    assert "files" not in kwargs
+    assert kwargs["data"].name == str(archive)
+    assert kwargs["headers"]["Content-Type"] == "application/zip"
+    assert kwargs["headers"]["Content-Disposition"] == 'attachment; filename="theme.zip"'
+    assert result["id"] == 7
+
+
+def test_upload_media_encodes_non_ascii_filename(tmp_path):
+    image = tmp_path / 'café "menu".png'
+    image.write_bytes(b"\x89PNG")
+    api = WordPressAPI("https://example.com/", "admin", "secret")
+
+    with patch("wpgen.wordpress.wordpress_api.requests.post") as mock_post:
+        mock_post.return_value.json.return_value = {"id": 8}
+        api.upload_media(str(image))
+
+    disposition = mock_post.call_args.kwargs["headers"]["Content-Disposition"]
+    assert disposition == (
+        'attachment; filename="cafe \\"menu\\".png"; '
+        "filename*=UTF-8''caf%C3%A9%20%22menu%22.png"
+    )
+    disposition.encode("latin-1")
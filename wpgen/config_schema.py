@@ -273,6 +273,38 @@ class ValidationConfig(BaseModel):
     php_path: str | None = Field(default="php", description="Path to PHP binary")
 
 
+class CacheConfig(BaseModel):
+    """Parsed requirements cache configuration."""
+    enabled: bool = Field(
+        default=False,
+        description="Reuse parsed requirements for identical prompts"
+    )
+    path: str | None = Field(
+        default=None,
+        description="SQLite cache file (defaults to <output_dir>/requirements.cache.db)"
+    )
+    ttl_seconds: int = Field(
+        default=86400,
+        ge=0,
+        description="Entry lifetime in seconds (0 = never expire)"
+    )
+    semantic: bool = Field(
+        default=False,
+        description="Also reuse requirements for paraphrased prompts (needs sentence-transformers)"
+    )
+    semantic_threshold: float = Field(
+        default=0.92,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity for a semantic hit"
+    )
+    semantic_max_temperature: float = Field(
+        default=0.3,
+        ge=0.0,
+        description="Skip semantic hits above this sampling temperature"
+    )
+
+
 class WPGenConfig(BaseModel):
     """Complete wpgen configuration schema."""
 
@@ -285,6 +317,7 @@ class WPGenConfig(BaseModel):
     deployment: DeploymentConfig = Field(default_factory=DeploymentConfig)
     wordpress_api: WordPressAPIConfig = Field(default_factory=WordPressAPIConfig)
     validation: ValidationConfig = Field(default_factory=ValidationConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
 
     model_config = ConfigDict(
         populate_by_name=True  # Allow field aliases
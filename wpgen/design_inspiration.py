@@ -3,9 +3,9 @@ Design Inspiration Configuration for WPGen
 Non-code inspiration references for modern ecommerce theme generation
 """
 
+import functools
 from typing import Any
 
-
 # Inspiration brand references (non-scraping, style guidance only)
 INSPIRATION_BRANDS = {
     'streetwear_modern': {
@@ -85,6 +85,7 @@ INSPIRATION_BRANDS = {
 }
 
 
+@functools.lru_cache(maxsize=64)
 def get_inspiration_context(profile_name: str) -> str:
     """
     Get inspiration context for a design profile
@@ -119,6 +120,7 @@ Create original implementations following these aesthetic principles.
     return context.strip()
 
 
+@functools.lru_cache(maxsize=1)
 def get_ecommerce_best_practices() -> str:
     """
     Get ecommerce best practices for theme generation
@@ -177,6 +179,7 @@ ECOMMERCE THEME BEST PRACTICES:
 """
 
 
+@functools.lru_cache(maxsize=1)
 def get_modern_design_trends() -> str:
     """
     Get current design trends for modern themes
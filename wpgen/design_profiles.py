@@ -519,14 +519,17 @@ def get_design_profile(profile_name: str = None) -> DesignProfile:
     Returns:
         DesignProfile object
     """
-    if profile_name and profile_name in DESIGN_PROFILES:
-        return DESIGN_PROFILES[profile_name]
-    return MODERN_STREETWEAR  # Default to streetwear_modern profile
+    # Default to streetwear_modern profile
+    return DESIGN_PROFILES.get(profile_name, MODERN_STREETWEAR)
 
 
-def get_profile_names() -> list:
-    """Get list of available profile names"""
-    return list(DESIGN_PROFILES.keys())
+# The registry is fixed at import time, so its names are materialized once
+_PROFILE_NAMES = tuple(DESIGN_PROFILES)
+
+
+def get_profile_names() -> tuple[str, ...]:
+    """Get the available profile names (including aliases)"""
+    return _PROFILE_NAMES
 
 
 def profile_to_css_variables(profile: DesignProfile) -> str:
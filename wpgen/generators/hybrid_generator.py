@@ -23,8 +23,8 @@ from typing import Any
 
 from ..llm.base import BaseLLMProvider
 from ..prompts import (
-    get_theme_spec_prompt,
-    get_theme_spec_system_prompt,
+    SYSTEM_PROMPT,
+    get_theme_spec_messages,
     parse_llm_json_response,
 )
 from ..schema import ThemeSpecification, get_default_theme_spec, validate_theme_spec
@@ -194,8 +194,8 @@ Be specific and concise. Focus on extractable design decisions."""
         Returns:
             Validated ThemeSpecification
         """
-        # Build the prompt
-        prompt = get_theme_spec_prompt(
+        # Build the prompt as cacheable content blocks
+        blocks = get_theme_spec_messages(
             user_prompt=user_prompt,
             design_profile=design_profile,
             woocommerce_enabled=woocommerce_enabled,
@@ -203,13 +203,11 @@ Be specific and concise. Focus on extractable design decisions."""
             image_analysis=image_analysis,
         )
 
-        system_prompt = get_theme_spec_system_prompt()
-
         # Call LLM
         try:
-            response = self.llm_provider.generate(
-                prompt=prompt,
-                system_prompt=system_prompt,
+            response = self.llm_provider.generate_from_blocks(
+                blocks,
+                system_prompt=SYSTEM_PROMPT,
             )
 
             logger.debug(f"LLM response length: {len(response) if response else 0}")
@@ -4,6 +4,7 @@ Implements the LLM provider interface using Anthropic's Claude API.
 """
 
 import json
+from collections.abc import Iterator
 from typing import Any
 
 from ..utils.logger import get_logger
@@ -65,6 +66,45 @@ class AnthropicProvider(BaseLLMProvider):
             logger.error(f"Anthropic API error: {str(e)}")
             raise
 
+    def generate_from_blocks(
+        self, blocks: list[dict[str, Any]], system_prompt: str | None = None
+    ) -> str:
+        """Generate text from content blocks, honouring their cache_control markers.
+
+        Args:
+            blocks: Text content blocks, static blocks first
+            system_prompt: Optional system prompt
+
+        Returns:
+            Generated text response
+
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            logger.debug(f"Sending {len(blocks)} content blocks to Anthropic Claude")
+
+            kwargs = {
+                "model": self.model,
+                "max_tokens": self.max_tokens,
+                "temperature": self.temperature,
+                "messages": [{"role": "user", "content": blocks}],
+            }
+
+            if system_prompt:
+                kwargs["system"] = system_prompt
+
+            response = self.client.messages.create(**kwargs)
+            self._log_cache_usage(response)
+
+            result = response.content[0].text
+            logger.info("Successfully generated response from Anthropic")
+            return result
+
+        except Exception as e:
+            logger.error(f"Anthropic API error: {str(e)}")
+            raise
+
     def generate_code(
         self,
         description: str,
@@ -166,17 +206,14 @@ Requirements:
             logger.error(f"Failed to generate {file_type} code: {str(e)}")
             raise
 
-    def analyze_prompt(self, prompt: str) -> dict[str, Any]:
-        """Analyze user prompt to extract WordPress theme requirements.
+    def _build_analysis_prompts(self, prompt: str) -> tuple[str, str]:
+        """Build the system and user prompts for requirements analysis.
 
         Args:
             prompt: Natural language description
 
         Returns:
-            Dictionary of extracted requirements
-
-        Raises:
-            Exception: If analysis fails
+            Tuple of (system_prompt, analysis_prompt)
         """
         system_prompt = """You are an expert at analyzing WordPress website requirements.
         Extract key information from user descriptions and return a structured JSON object.
@@ -207,6 +244,37 @@ Requirements:
             "Return ONLY valid JSON, no other text."
         )
 
+        return system_prompt, analysis_prompt
+
+    def _log_cache_usage(self, response: Any) -> None:
+        """Log prompt cache reads and writes reported for a response.
+
+        Args:
+            response: Messages API response
+        """
+        usage = getattr(response, "usage", None)
+        cache_read = getattr(usage, "cache_read_input_tokens", None)
+        cache_write = getattr(usage, "cache_creation_input_tokens", None)
+        if isinstance(cache_read, int) or isinstance(cache_write, int):
+            logger.debug(
+                f"Anthropic prompt cache: read={cache_read or 0} tokens, "
+                f"written={cache_write or 0} tokens"
+            )
+
+    def analyze_prompt(self, prompt: str) -> dict[str, Any]:
+        """Analyze user prompt to extract WordPress theme requirements.
+
+        Args:
+            prompt: Natural language description
+
+        Returns:
+            Dictionary of extracted requirements
+
+        Raises:
+            Exception: If analysis fails
+        """
+        system_prompt, analysis_prompt = self._build_analysis_prompts(prompt)
+
         try:
             response = self.generate(analysis_prompt, system_prompt)
 
@@ -253,6 +321,27 @@ Requirements:
                 "integrations": [],
             }
 
+    def stream_analyze_prompt(self, prompt: str) -> Iterator[str]:
+        """Stream a requirements analysis from Anthropic's Claude API.
+
+        Args:
+            prompt: Natural language description
+
+        Yields:
+            Response text chunks as they arrive
+        """
+        system_prompt, analysis_prompt = self._build_analysis_prompts(prompt)
+
+        logger.debug("Streaming prompt analysis from Anthropic Claude")
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            system=system_prompt,
+            messages=[{"role": "user", "content": analysis_prompt}],
+        ) as stream:
+            yield from stream.text_stream
+
     def analyze_prompt_multimodal(
         self,
         prompt: str,
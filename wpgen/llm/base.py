@@ -4,6 +4,7 @@ Defines the abstract interface that all LLM providers must implement.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any
 
 
@@ -39,6 +40,25 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    def generate_from_blocks(
+        self, blocks: list[dict[str, Any]], system_prompt: str | None = None
+    ) -> str:
+        """Generate text from a prompt split into content blocks.
+
+        Blocks may carry ``cache_control`` markers for providers with explicit
+        prompt caching. The default joins the block texts with blank lines and
+        calls generate(), which keeps the static blocks as a shared prefix.
+
+        Args:
+            blocks: Text content blocks, static blocks first
+            system_prompt: Optional system prompt to guide the LLM
+
+        Returns:
+            Generated text response
+        """
+        prompt = "\n\n".join(block["text"] for block in blocks)
+        return self.generate(prompt, system_prompt=system_prompt)
+
     @abstractmethod
     def generate_code(
         self,
@@ -85,6 +105,20 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    def stream_analyze_prompt(self, prompt: str) -> Iterator[str]:
+        """Stream the raw text of a requirements analysis as it is generated.
+
+        Args:
+            prompt: Natural language description of the website
+
+        Yields:
+            Response text chunks containing the requirements JSON
+
+        Raises:
+            NotImplementedError: If streaming not supported by provider
+        """
+        raise NotImplementedError("Streaming analysis not implemented for this provider")
+
     def analyze_image(self, image_data: dict[str, Any], prompt: str) -> dict[str, Any]:
         """Analyze a single image with vision capabilities.
 
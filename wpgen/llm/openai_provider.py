@@ -4,6 +4,7 @@ Implements the LLM provider interface using OpenAI's API.
 """
 
 import json
+from collections.abc import Iterator
 from typing import Any
 
 from ..utils.logger import get_logger
@@ -173,17 +174,14 @@ Requirements:
             logger.error(f"Failed to generate {file_type} code: {str(e)}")
             raise
 
-    def analyze_prompt(self, prompt: str) -> dict[str, Any]:
-        """Analyze user prompt to extract WordPress theme requirements.
+    def _build_analysis_prompts(self, prompt: str) -> tuple[str, str]:
+        """Build the system and user prompts for requirements analysis.
 
         Args:
             prompt: Natural language description
 
         Returns:
-            Dictionary of extracted requirements
-
-        Raises:
-            Exception: If analysis fails
+            Tuple of (system_prompt, analysis_prompt)
         """
         system_prompt = """You are an expert at analyzing WordPress website requirements.
         Extract key information from user descriptions and return a structured JSON object.
@@ -214,6 +212,22 @@ Requirements:
             "Return ONLY valid JSON, no other text."
         )
 
+        return system_prompt, analysis_prompt
+
+    def analyze_prompt(self, prompt: str) -> dict[str, Any]:
+        """Analyze user prompt to extract WordPress theme requirements.
+
+        Args:
+            prompt: Natural language description
+
+        Returns:
+            Dictionary of extracted requirements
+
+        Raises:
+            Exception: If analysis fails
+        """
+        system_prompt, analysis_prompt = self._build_analysis_prompts(prompt)
+
         try:
             # Use JSON mode for supported models to ensure valid JSON output
             try:
@@ -276,6 +290,33 @@ Requirements:
                 "integrations": [],
             }
 
+    def stream_analyze_prompt(self, prompt: str) -> Iterator[str]:
+        """Stream a requirements analysis from OpenAI's API.
+
+        Args:
+            prompt: Natural language description
+
+        Yields:
+            Response text chunks as they arrive
+        """
+        system_prompt, analysis_prompt = self._build_analysis_prompts(prompt)
+
+        logger.debug("Streaming prompt analysis from OpenAI")
+        with self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": analysis_prompt},
+            ],
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            response_format={"type": "json_object"},
+            stream=True,
+        ) as stream:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
     def analyze_prompt_multimodal(
         self,
         prompt: str,
@@ -1,5 +1,5 @@
 """Prompt parsing modules for wpgen."""
 
-from .prompt_parser import PromptParser
+from .prompt_parser import PromptParser, ThemeFeatures
 
-__all__ = ["PromptParser"]
+__all__ = ["PromptParser", "ThemeFeatures"]
@@ -4,13 +4,146 @@ This module takes natural language descriptions and converts them into
 structured theme requirements using LLM providers.
 """
 
+import enum
+import json
+import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ..llm.base import BaseLLMProvider
+from ..utils.image_analysis import prepare_image_for_vision
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Minimum template set every generated theme must include
+_REQUIRED_PAGES = ("index", "single", "archive")
+
+
+class ThemeFeatures(enum.IntFlag):
+    """Feature flags extracted from parsed requirements."""
+
+    BLOG = 1
+    PORTFOLIO = 2
+    CONTACT_FORM = 4
+    GALLERY = 8
+    ECOMMERCE = 16
+    CUSTOM_POST_TYPES = 32
+    WIDGETS = 64
+    CUSTOMIZER = 128
+
+    def to_dict(self) -> dict[str, bool]:
+        """Expand the flags into the legacy ``{feature_name: bool}`` mapping.
+
+        Returns:
+            Dictionary mapping lowercase feature names to boolean flags
+        """
+        return {member.name.lower(): member in self for member in ThemeFeatures}
+
+
+# Keyword classifiers for extract_features; group names match ThemeFeatures members.
+# google-re2 matches the alternation with a linear-time DFA when installed; the
+# inline (?i) flag keeps the patterns portable between both engines.
+try:
+    import re2 as _feature_re
+except ImportError:
+    _feature_re = re
+
+_FEATURE_RX = _feature_re.compile(
+    r"(?i)(?P<BLOG>blog)"
+    r"|(?P<PORTFOLIO>portfolio)"
+    r"|(?P<CONTACT_FORM>contact|form)"
+    r"|(?P<GALLERY>gallery|photo)"
+    r"|(?P<ECOMMERCE>shop|ecommerce|woocommerce)"
+)
+_INTEGRATION_RX = _feature_re.compile(r"(?i)(?P<ECOMMERCE>woocommerce)|(?P<CONTACT_FORM>contact)")
+
+
+def _fallback_requirements(prompt: str) -> dict[str, Any]:
+    """Build the default requirements used when prompt parsing fails.
+
+    Args:
+        prompt: Original user prompt
+
+    Returns:
+        Generic blog theme requirements described by the prompt
+    """
+    return {
+        "theme_name": "wpgen-theme",
+        "theme_display_name": "WPGen Theme",
+        "description": f"A WordPress theme based on: {prompt[:100]}...",
+        "color_scheme": "default",
+        "features": ["blog"],
+        "pages": list(_REQUIRED_PAGES),
+        "layout": "full-width",
+        "post_types": [],
+        "navigation": ["header-menu"],
+        "integrations": [],
+    }
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_streamed_json(chunks: Iterable[str]) -> dict[str, Any]:
+    """Decode the first JSON object from a stream of response text chunks.
+
+    Consumption stops as soon as the top-level object's closing brace arrives,
+    so trailing commentary from the model is never waited on.
+
+    Args:
+        chunks: Response text chunks in arrival order
+
+    Returns:
+        The first complete JSON object in the stream
+
+    Raises:
+        ValueError: If the stream ends before a complete JSON object is seen
+    """
+    buffer: list[str] = []
+    depth = 0
+    in_string = False
+    escape_next = False
+    complete = False
+
+    for chunk in chunks:
+        buffer.append(chunk)
+        for char in chunk:
+            if escape_next:
+                escape_next = False
+            elif in_string:
+                if char == "\\":
+                    escape_next = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = depth > 0
+            elif char == "{":
+                depth += 1
+            elif char == "}" and depth > 0:
+                depth -= 1
+                complete = depth == 0
+                if complete:
+                    break
+        if complete:
+            break
+
+    # Stop the underlying HTTP stream once the object is complete
+    close = getattr(chunks, "close", None)
+    if close is not None:
+        close()
+
+    text = "".join(buffer)
+    start = text.find("{")
+    if start == -1:
+        raise ValueError("No JSON object found in streamed response")
+
+    result, _ = _JSON_DECODER.raw_decode(text, start)
+    if not isinstance(result, dict):
+        raise ValueError("Streamed response JSON is not an object")
+    return result
+
 
 class PromptParser:
     """Parser for converting natural language prompts to structured requirements."""
@@ -47,37 +180,52 @@ class PromptParser:
             ValueError: If prompt is empty or invalid
             Exception: If parsing fails
         """
+        return self.parse_with_status(prompt)[0]
+
+    def parse_with_status(self, prompt: str) -> tuple[dict[str, Any], bool]:
+        """Parse a prompt and report whether the LLM result was used.
+
+        Args:
+            prompt: Natural language description of the WordPress site
+
+        Returns:
+            Tuple of the requirements dictionary (see parse()) and a flag that is
+            False when parsing failed and the generic fallback spec was returned
+
+        Raises:
+            ValueError: If prompt is empty or invalid
+        """
         if not prompt or not prompt.strip():
             raise ValueError("Prompt cannot be empty")
 
         logger.info(f"Parsing prompt: {prompt[:100]}...")
 
         try:
-            # Use the LLM provider to analyze the prompt
-            requirements = self.llm_provider.analyze_prompt(prompt)
+            # Stream the analysis when supported so parsing can finish as soon as
+            # the JSON object closes; otherwise wait for the full completion
+            try:
+                requirements = _decode_streamed_json(
+                    self.llm_provider.stream_analyze_prompt(prompt)
+                )
+            except NotImplementedError:
+                requirements = self.llm_provider.analyze_prompt(prompt)
+            except Exception as e:
+                # A dropped stream or malformed JSON gets the regular completion,
+                # which has its own JSON-mode and extraction fallbacks
+                logger.warning(f"Streamed analysis failed, retrying without streaming: {e}")
+                requirements = self.llm_provider.analyze_prompt(prompt)
 
             # Validate and normalize the requirements
             requirements = self._validate_requirements(requirements)
 
             logger.info(f"Successfully parsed prompt into theme: {requirements['theme_name']}")
-            return requirements
+            return requirements, True
 
         except Exception as e:
             logger.error(f"Failed to parse prompt: {str(e)}")
             # Return fallback structure instead of raising
             logger.warning("Using fallback theme structure due to parsing failure")
-            return {
-                "theme_name": "wpgen-theme",
-                "theme_display_name": "WPGen Theme",
-                "description": f"A WordPress theme based on: {prompt[:100]}...",
-                "color_scheme": "default",
-                "features": ["blog"],
-                "pages": ["index", "single", "archive"],
-                "layout": "full-width",
-                "post_types": [],
-                "navigation": ["header-menu"],
-                "integrations": [],
-            }
+            return _fallback_requirements(prompt), False
 
     def parse_multimodal(
         self,
@@ -109,6 +257,11 @@ class PromptParser:
         )
 
         try:
+            # Downscale images concurrently; decoding and resampling release the GIL
+            if images:
+                with ThreadPoolExecutor(max_workers=min(8, len(images))) as executor:
+                    images = list(executor.map(prepare_image_for_vision, images))
+
             # Use the LLM provider's multi-modal analyze method
             requirements = self.llm_provider.analyze_prompt_multimodal(
                 prompt, images=images, additional_context=additional_context
@@ -126,18 +279,7 @@ class PromptParser:
             logger.error(f"Failed to parse multi-modal prompt: {str(e)}")
             # Return fallback structure instead of raising
             logger.warning("Using fallback theme structure due to parsing failure")
-            return {
-                "theme_name": "wpgen-theme",
-                "theme_display_name": "WPGen Theme",
-                "description": f"A WordPress theme based on: {prompt[:100]}...",
-                "color_scheme": "default",
-                "features": ["blog"],
-                "pages": ["index", "single", "archive"],
-                "layout": "full-width",
-                "post_types": [],
-                "navigation": ["header-menu"],
-                "integrations": [],
-            }
+            return _fallback_requirements(prompt)
 
     def _validate_requirements(self, requirements: dict[str, Any]) -> dict[str, Any]:
         """Validate and normalize parsed requirements.
@@ -163,7 +305,9 @@ class PromptParser:
 
         if "theme_display_name" not in requirements:
             logger.warning("Missing theme_display_name, generating from theme_name")
-            requirements["theme_display_name"] = requirements["theme_name"].replace("-", " ").title()
+            requirements["theme_display_name"] = (
+                requirements["theme_name"].replace("-", " ").title()
+            )
 
         if "description" not in requirements:
             logger.warning("Missing description, using default")
@@ -179,17 +323,17 @@ class PromptParser:
 
         # Ensure arrays are actually arrays with string elements
         array_fields = ["features", "pages", "post_types", "navigation", "integrations"]
-        for field in array_fields:
-            if field not in requirements:
-                requirements[field] = []
-            elif not isinstance(requirements[field], list):
+        for name in array_fields:
+            if name not in requirements:
+                requirements[name] = []
+            elif not isinstance(requirements[name], list):
                 # Convert single value to list
-                requirements[field] = [str(requirements[field])]
+                requirements[name] = [str(requirements[name])]
             else:
                 # Ensure all items in the list are strings
-                requirements[field] = [
+                requirements[name] = [
                     str(item) if not isinstance(item, str) else item
-                    for item in requirements[field]
+                    for item in requirements[name]
                 ]
 
         # Normalize page names to lowercase, kebab-case (WordPress template naming requirement)
@@ -208,22 +352,24 @@ class PromptParser:
 
         # Ensure scalar string fields are actually strings (not dicts or other types)
         string_fields = ["color_scheme", "layout", "description", "theme_display_name"]
-        for field in string_fields:
-            if field in requirements and not isinstance(requirements[field], str):
+        for name in string_fields:
+            if name in requirements and not isinstance(requirements[name], str):
                 # Convert dict or other types to string representation
-                if isinstance(requirements[field], dict):
+                if isinstance(requirements[name], dict):
                     # For dicts, try to extract a reasonable string value
-                    if field == "color_scheme" and "primary" in requirements[field]:
-                        requirements[field] = str(requirements[field]["primary"])
-                    elif "value" in requirements[field]:
-                        requirements[field] = str(requirements[field]["value"])
+                    if name == "color_scheme" and "primary" in requirements[name]:
+                        requirements[name] = str(requirements[name]["primary"])
+                    elif "value" in requirements[name]:
+                        requirements[name] = str(requirements[name]["value"])
                     else:
                         # Use first value if dict
-                        values = list(requirements[field].values())
-                        requirements[field] = str(values[0]) if values else "default"
+                        values = list(requirements[name].values())
+                        requirements[name] = str(values[0]) if values else "default"
                 else:
-                    requirements[field] = str(requirements[field])
-                logger.warning(f"Converted {field} from {type(requirements[field]).__name__} to string")
+                    requirements[name] = str(requirements[name])
+                logger.warning(
+                    f"Converted {name} from {type(requirements[name]).__name__} to string"
+                )
 
         # Set defaults for optional fields
         if "color_scheme" not in requirements:
@@ -234,65 +380,41 @@ class PromptParser:
 
         # Ensure minimum required pages exist
         if not requirements["pages"]:  # If pages list is empty
-            requirements["pages"] = ["index", "single", "archive"]
+            requirements["pages"] = list(_REQUIRED_PAGES)
         else:
-            required_pages = ["index", "single", "archive"]
-            for page in required_pages:
-                if page not in requirements["pages"]:
-                    requirements["pages"].append(page)
+            have = set(requirements["pages"])
+            missing = [page for page in _REQUIRED_PAGES if page not in have]
+            if missing:
+                requirements["pages"].extend(missing)
 
         logger.debug(f"Validated requirements: {requirements}")
         return requirements
 
-    def extract_features(self, requirements: dict[str, Any]) -> dict[str, bool]:
+    def extract_features(self, requirements: dict[str, Any]) -> ThemeFeatures:
         """Extract and categorize features from requirements.
 
         Args:
             requirements: Parsed requirements dictionary
 
         Returns:
-            Dictionary mapping feature names to boolean flags
+            ThemeFeatures flags; call ``.to_dict()`` for the name-to-bool mapping
         """
-        features = {
-            "blog": False,
-            "portfolio": False,
-            "contact_form": False,
-            "gallery": False,
-            "ecommerce": False,
-            "custom_post_types": False,
-            "widgets": True,  # Always include widgets
-            "customizer": True,  # Always include customizer
-        }
+        # Widgets and customizer are always included
+        flags = ThemeFeatures.WIDGETS | ThemeFeatures.CUSTOMIZER
 
         # Check features list
         for feature in requirements.get("features", []):
-            feature_lower = feature.lower()
-            if "blog" in feature_lower:
-                features["blog"] = True
-            if "portfolio" in feature_lower:
-                features["portfolio"] = True
-            if "contact" in feature_lower or "form" in feature_lower:
-                features["contact_form"] = True
-            if "gallery" in feature_lower or "photo" in feature_lower:
-                features["gallery"] = True
-            if (
-                "shop" in feature_lower
-                or "ecommerce" in feature_lower
-                or "woocommerce" in feature_lower
-            ):
-                features["ecommerce"] = True
+            for match in _FEATURE_RX.finditer(feature):
+                flags |= ThemeFeatures[match.lastgroup]
 
         # Check custom post types
         if requirements.get("post_types"):
-            features["custom_post_types"] = True
+            flags |= ThemeFeatures.CUSTOM_POST_TYPES
 
         # Check integrations
         integrations = requirements.get("integrations", [])
         for integration in integrations:
-            integration_lower = integration.lower()
-            if "woocommerce" in integration_lower:
-                features["ecommerce"] = True
-            if "contact" in integration_lower:
-                features["contact_form"] = True
+            for match in _INTEGRATION_RX.finditer(integration):
+                flags |= ThemeFeatures[match.lastgroup]
 
-        return features
+        return flags
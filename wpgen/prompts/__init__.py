@@ -6,6 +6,9 @@ is generated directly by the LLM.
 """
 
 from .theme_prompts import (
+    SCHEMA_DESCRIPTION,
+    SYSTEM_PROMPT,
+    get_theme_spec_messages,
     get_theme_spec_prompt,
     get_theme_spec_system_prompt,
     get_schema_description,
@@ -13,6 +16,9 @@ from .theme_prompts import (
 )
 
 __all__ = [
+    "SCHEMA_DESCRIPTION",
+    "SYSTEM_PROMPT",
+    "get_theme_spec_messages",
     "get_theme_spec_prompt",
     "get_theme_spec_system_prompt",
     "get_schema_description",
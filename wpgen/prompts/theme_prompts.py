@@ -8,23 +8,63 @@ The JSON is then rendered through Jinja2 templates to produce valid WordPress
 theme files, guaranteeing no syntax errors or hallucinated functions.
 """
 
+import contextlib
+import functools
+import io
 import json
 import re
-from typing import Any
+import sys
+import time
+from collections.abc import Iterator
+from typing import Any, Final
+
+from pydantic import ValidationError
 
-from ..design_inspiration import (
-    get_ecommerce_best_practices,
-    get_inspiration_context,
-    get_modern_design_trends,
-)
 from ..schema import ThemeSpecification, get_default_theme_spec, validate_theme_spec
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Prefer orjson for parsing LLM output when installed; its JSONDecodeError
+# subclasses json.JSONDecodeError so error handling below is unchanged
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+# Patterns used to clean and repair LLM JSON output, compiled once at import
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+_SINGLE_QUOTE_KEY_RE = re.compile(r"'(\w+)':")
+_BAREWORD_VALUE_RE = re.compile(r':\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*([,}\]])')
+_PY_LITERALS_RE = re.compile(r'\b(True|False|None)\b')
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+# Parses slower than this log their per-phase timings
+_SLOW_PARSE_MS = 50
+
+# JSONDecodeError messages (stdlib and orjson) for damage _try_fix_json cannot
+# repair; orjson reports trailing commas as "unexpected end of data", so the
+# check has to exclude hopeless classes rather than list fixable ones
+_UNFIXABLE_JSON_ERRORS = (
+    # stdlib json
+    "Unterminated string",
+    "Invalid control character",
+    "Invalid \\escape",
+    "Expecting ':' delimiter",
+    "Extra data",
+    # orjson
+    "unexpected control character",
+    "invalid escaped character",
+    "unexpected content after document",
+    "input length is 0",
+)
 
-# JSON Schema description for the LLM
-SCHEMA_DESCRIPTION = """
+
+# JSON Schema description for the LLM; prompt constants are interned so prompt
+# cache keys built from them compare by identity
+SCHEMA_DESCRIPTION: Final[str] = sys.intern("""
 ## Theme Specification JSON Schema
 
 You MUST output valid JSON following this exact schema:
@@ -135,10 +175,12 @@ IMPORTANT RULES:
 3. Theme name MUST be lowercase with hyphens only (no spaces, no special chars)
 4. All boolean values must be true/false (not "true"/"false")
 5. All numbers must be actual numbers (not strings)
-"""
+""")
 
 
-SYSTEM_PROMPT = """You are a WordPress theme specification generator. Your ONLY job is to output valid JSON that describes a WordPress theme's design and structure.
+SYSTEM_PROMPT: Final[str] = sys.intern(
+    """\
+You are a WordPress theme specification generator. Your ONLY job is to output valid JSON that describes a WordPress theme's design and structure.
 
 CRITICAL RULES:
 1. Output ONLY valid JSON - nothing else, no explanations, no markdown
@@ -151,6 +193,13 @@ CRITICAL RULES:
 Your JSON will be processed by a template engine to generate the actual WordPress theme files. You are NOT generating code - you are generating a specification.
 
 Think of yourself as a designer creating a design document, not a developer writing code."""
+)
+
+
+# Fixed tail of every theme spec prompt
+_CLOSING_INSTRUCTION = (
+    "Now generate the JSON theme specification. Output ONLY the JSON, nothing else."
+)
 
 
 def get_theme_spec_system_prompt() -> str:
@@ -171,14 +220,14 @@ def get_schema_description() -> str:
     return SCHEMA_DESCRIPTION
 
 
-def get_theme_spec_prompt(
+def _build_prompt_sections(
     user_prompt: str,
-    design_profile: dict[str, Any] | None = None,
-    woocommerce_enabled: bool = False,
-    dark_mode_enabled: bool = False,
-    image_analysis: str | None = None,
-) -> str:
-    """Generate the complete prompt for theme specification.
+    design_profile: dict[str, Any] | None,
+    woocommerce_enabled: bool,
+    dark_mode_enabled: bool,
+    image_analysis: str | None,
+) -> tuple[str, str, str]:
+    """Build the theme spec prompt as static, semi-static and per-request sections.
 
     Args:
         user_prompt: User's description of the theme they want
@@ -188,86 +237,147 @@ def get_theme_spec_prompt(
         image_analysis: Optional analysis of uploaded design images
 
     Returns:
-        Complete prompt string for the LLM
+        Tuple of (schema, guidance, request); guidance may be empty
     """
-    prompt_parts = [
-        "Generate a WordPress theme specification based on the following request:",
-        "",
-        f"USER REQUEST: {user_prompt}",
-        "",
-    ]
+    # Imported lazily so parse-only callers never load the guidance data
+    from ..design_inspiration import (
+        get_ecommerce_best_practices,
+        get_inspiration_context,
+        get_modern_design_trends,
+    )
 
-    # Add image analysis if available
-    if image_analysis:
-        prompt_parts.extend([
-            "DESIGN REFERENCE ANALYSIS:",
-            image_analysis,
-            "",
-        ])
+    guidance_blocks: list[str] = []
+
+    if design_profile or woocommerce_enabled:
+        design_trends = get_modern_design_trends()
+        if design_trends:
+            guidance_blocks.append(design_trends)
+
+    if woocommerce_enabled:
+        ecommerce_best_practices = get_ecommerce_best_practices()
+        if ecommerce_best_practices:
+            guidance_blocks.append(ecommerce_best_practices)
+
+    if design_profile:
+        inspiration_context = get_inspiration_context(design_profile.get("name", ""))
+        if inspiration_context:
+            guidance_blocks.append(inspiration_context)
+
+    request = io.StringIO()
+    request.write("Generate a WordPress theme specification based on the following request:\n\n")
 
     # Add design profile if available
     if design_profile:
-        prompt_parts.extend([
-            "DESIGN SYSTEM TO FOLLOW:",
-            f"- Profile: {design_profile.get('name', 'custom')}",
-            f"- Description: {design_profile.get('description', '')}",
-        ])
+        request.write("DESIGN SYSTEM TO FOLLOW:\n")
+        request.write(f"- Profile: {design_profile.get('name', 'custom')}\n")
+        request.write(f"- Description: {design_profile.get('description', '')}\n")
 
         if 'colors' in design_profile:
             colors = design_profile['colors']
-            prompt_parts.append(f"- Colors: Primary={colors.get('primary', '#1a1a2e')}, "
-                              f"Accent={colors.get('accent', '#e94560')}")
+            request.write(f"- Colors: Primary={colors.get('primary', '#1a1a2e')}, "
+                          f"Accent={colors.get('accent', '#e94560')}\n")
 
         if 'fonts' in design_profile:
             fonts = design_profile['fonts']
-            prompt_parts.append(f"- Fonts: Primary={fonts.get('primary', 'Inter')}, "
-                              f"Headings={fonts.get('headings', 'Inter')}")
+            request.write(f"- Fonts: Primary={fonts.get('primary', 'Inter')}, "
+                          f"Headings={fonts.get('headings', 'Inter')}\n")
 
-        prompt_parts.append("")
+        request.write("\n")
 
     # Add feature flags
-    feature_notes = []
-    if woocommerce_enabled:
-        feature_notes.append("- WooCommerce support is REQUIRED (set woocommerce.enabled to true)")
-    if dark_mode_enabled:
-        feature_notes.append("- Dark mode toggle is REQUIRED (set dark_mode to true)")
+    if woocommerce_enabled or dark_mode_enabled:
+        request.write("REQUIRED FEATURES:\n")
+        if woocommerce_enabled:
+            request.write("- WooCommerce support is REQUIRED (set woocommerce.enabled to true)\n")
+        if dark_mode_enabled:
+            request.write("- Dark mode toggle is REQUIRED (set dark_mode to true)\n")
+        request.write("\n")
 
-    if feature_notes:
-        prompt_parts.extend([
-            "REQUIRED FEATURES:",
-            *feature_notes,
-            "",
-        ])
+    # Add image analysis if available
+    if image_analysis:
+        request.write(f"DESIGN REFERENCE ANALYSIS:\n{image_analysis}\n\n")
 
-    guidance_blocks: list[str] = []
+    request.write(f"USER REQUEST: {user_prompt}\n\n")
+    request.write(_CLOSING_INSTRUCTION)
 
-    if design_profile:
-        inspiration_context = get_inspiration_context(design_profile.get("name", ""))
-        if inspiration_context:
-            guidance_blocks.append(inspiration_context)
+    return SCHEMA_DESCRIPTION, "\n".join(guidance_blocks), request.getvalue()
 
-    if design_profile or woocommerce_enabled:
-        design_trends = get_modern_design_trends()
-        if design_trends:
-            guidance_blocks.append(design_trends)
 
-    if woocommerce_enabled:
-        ecommerce_best_practices = get_ecommerce_best_practices()
-        if ecommerce_best_practices:
-            guidance_blocks.append(ecommerce_best_practices)
+def get_theme_spec_prompt(
+    user_prompt: str,
+    design_profile: dict[str, Any] | None = None,
+    woocommerce_enabled: bool = False,
+    dark_mode_enabled: bool = False,
+    image_analysis: str | None = None,
+) -> str:
+    """Generate the complete prompt for theme specification.
+
+    The static schema comes first, then guidance, then the per-request
+    details, so consecutive prompts share the longest possible prefix.
+
+    Args:
+        user_prompt: User's description of the theme they want
+        design_profile: Optional design profile to apply
+        woocommerce_enabled: Whether WooCommerce support is requested
+        dark_mode_enabled: Whether dark mode is requested
+        image_analysis: Optional analysis of uploaded design images
+
+    Returns:
+        Complete prompt string for the LLM
+    """
+    sections = _build_prompt_sections(
+        user_prompt, design_profile, woocommerce_enabled, dark_mode_enabled, image_analysis
+    )
+    return "\n\n".join(section for section in sections if section)
+
+
+def get_theme_spec_messages(
+    user_prompt: str,
+    design_profile: dict[str, Any] | None = None,
+    woocommerce_enabled: bool = False,
+    dark_mode_enabled: bool = False,
+    image_analysis: str | None = None,
+) -> list[dict[str, Any]]:
+    """Generate the theme spec prompt as content blocks with cache breakpoints.
+
+    The schema and guidance blocks carry ``cache_control`` markers so providers
+    with prompt caching can reuse them across requests. Joining the block texts
+    with blank lines yields exactly ``get_theme_spec_prompt()``.
+
+    Args:
+        user_prompt: User's description of the theme they want
+        design_profile: Optional design profile to apply
+        woocommerce_enabled: Whether WooCommerce support is requested
+        dark_mode_enabled: Whether dark mode is requested
+        image_analysis: Optional analysis of uploaded design images
+
+    Returns:
+        List of text content blocks, static blocks first
+    """
+    schema, guidance, request = _build_prompt_sections(
+        user_prompt, design_profile, woocommerce_enabled, dark_mode_enabled, image_analysis
+    )
+
+    blocks = [{"type": "text", "text": schema, "cache_control": {"type": "ephemeral"}}]
+    if guidance:
+        blocks.append(
+            {"type": "text", "text": guidance, "cache_control": {"type": "ephemeral"}}
+        )
+    blocks.append({"type": "text", "text": request})
+    return blocks
+
 
-    if guidance_blocks:
-        prompt_parts.extend(guidance_blocks)
-        prompt_parts.append("")
+# Built once; fallbacks hand out deep copies because the renderer mutates specs
+_DEFAULT_SPEC = get_default_theme_spec()
 
-    # Add schema
-    prompt_parts.extend([
-        SCHEMA_DESCRIPTION,
-        "",
-        "Now generate the JSON theme specification. Output ONLY the JSON, nothing else.",
-    ])
 
-    return "\n".join(prompt_parts)
+def _get_cached_default() -> ThemeSpecification:
+    """Return a fresh copy of the default theme specification.
+
+    Returns:
+        Deep copy of the module-level default spec
+    """
+    return _DEFAULT_SPEC.model_copy(deep=True)
 
 
 def parse_llm_json_response(
@@ -282,50 +392,134 @@ def parse_llm_json_response(
     - Invalid JSON that needs correction
     - Missing required fields
 
+    Identical responses (retries, regenerations) are served from an LRU cache;
+    callers always get their own copy of the spec and error list.
+
     Args:
         response: Raw LLM response string
         fallback_to_defaults: Whether to use defaults for missing fields
 
+    Returns:
+        Tuple of (success, specification, errors)
+    """
+    success, spec, errors = _parse_llm_json_response_cached(response, fallback_to_defaults)
+    if spec is not None:
+        spec = spec.model_copy(deep=True)
+    return success, spec, list(errors)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_llm_json_response_cached(
+    response: str,
+    fallback_to_defaults: bool
+) -> tuple[bool, ThemeSpecification | None, tuple[str, ...]]:
+    """Parse an LLM response once per distinct (response, fallback) pair.
+
+    Args:
+        response: Raw LLM response string
+        fallback_to_defaults: Whether to use defaults for missing fields
+
+    Returns:
+        Tuple of (success, specification, errors); shared, so never mutate it
+    """
+    phases: dict[str, float] = {}
+    start = time.perf_counter()
+    try:
+        success, spec, errors = _parse_llm_json_response(response, fallback_to_defaults, phases)
+    finally:
+        total_ms = (time.perf_counter() - start) * 1000
+        if total_ms > _SLOW_PARSE_MS:
+            logger.info(
+                f"Slow LLM JSON parse: {total_ms:.1f}ms over {len(response)} chars",
+                extra={
+                    "parse_phases": {name: round(ms, 3) for name, ms in phases.items()},
+                    "parse_total_ms": round(total_ms, 3),
+                    "response_chars": len(response),
+                },
+            )
+    return success, spec, tuple(errors)
+
+
+@contextlib.contextmanager
+def _phase(name: str, sink: dict[str, float]) -> Iterator[None]:
+    """Record the wall time of a parse phase in milliseconds.
+
+    Args:
+        name: Phase name used as the key in sink
+        sink: Mapping that accumulates phase timings
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        sink[name] = sink.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+
+def _parse_llm_json_response(
+    response: str,
+    fallback_to_defaults: bool,
+    phases: dict[str, float]
+) -> tuple[bool, ThemeSpecification | None, list[str]]:
+    """Run the clean, decode, repair and validate pipeline on a response.
+
+    Args:
+        response: Raw LLM response string
+        fallback_to_defaults: Whether to use defaults for missing fields
+        phases: Receives the wall time in milliseconds of each phase that ran
+
     Returns:
         Tuple of (success, specification, errors)
     """
     errors = []
 
     # Clean the response
-    cleaned = _clean_json_response(response)
+    with _phase("clean", phases):
+        cleaned = _clean_json_response(response)
 
     if not cleaned:
         errors.append("No JSON found in response")
         if fallback_to_defaults:
             logger.warning("Using default theme specification")
-            return True, get_default_theme_spec(), errors
+            return True, _get_cached_default(), errors
         return False, None, errors
 
+    # Fast path: parse and validate straight from the JSON text in pydantic-core,
+    # skipping the intermediate dict; anything it rejects takes the repair route
+    try:
+        with _phase("validate_json", phases):
+            return True, ThemeSpecification.model_validate_json(cleaned), errors
+    except ValidationError:
+        pass
+
     # Try to parse JSON
     try:
-        data = json.loads(cleaned)
+        with _phase("loads", phases):
+            data = _json_loads(cleaned)
     except json.JSONDecodeError as e:
         errors.append(f"JSON parse error: {e}")
 
         # Try to fix common JSON issues
-        fixed = _try_fix_json(cleaned)
+        with _phase("fix", phases):
+            fixed = _try_fix_json(cleaned) if _is_fixable_json_error(e) else None
         if fixed:
             try:
-                data = json.loads(fixed)
+                with _phase("loads", phases):
+                    data = _json_loads(fixed)
                 errors.append("Fixed JSON syntax issues")
             except json.JSONDecodeError:
                 if fallback_to_defaults:
                     logger.warning("JSON parsing failed, using defaults")
-                    return True, get_default_theme_spec(), errors
+                    return True, _get_cached_default(), errors
                 return False, None, errors
         else:
             if fallback_to_defaults:
                 logger.warning("JSON parsing failed, using defaults")
-                return True, get_default_theme_spec(), errors
+                return True, _get_cached_default(), errors
             return False, None, errors
 
     # Validate against schema
-    is_valid, validation_errors, spec = validate_theme_spec(data)
+    with _phase("validate", phases):
+        is_valid, validation_errors, spec = validate_theme_spec(data)
 
     if validation_errors:
         errors.extend(validation_errors)
@@ -333,7 +527,7 @@ def parse_llm_json_response(
     if not is_valid:
         if fallback_to_defaults:
             logger.warning("Schema validation failed, using defaults")
-            return True, get_default_theme_spec(), errors
+            return True, _get_cached_default(), errors
         return False, None, errors
 
     return True, spec, errors
@@ -353,32 +547,86 @@ def _clean_json_response(response: str) -> str | None:
 
     text = response.strip()
 
+    # Fast path: the model followed instructions and returned a bare object
+    if text.startswith('{') and text.endswith('}'):
+        return text
+
+    logger.debug("LLM response needs cleanup before JSON parsing")
+
     # Remove markdown code fences
-    # Handle ```json ... ``` or ``` ... ```
-    code_fence_pattern = r'```(?:json)?\s*\n?(.*?)\n?```'
-    match = re.search(code_fence_pattern, text, re.DOTALL)
-    if match:
-        text = match.group(1).strip()
+    # Handle ```json ... ``` or ``` ... ``` with C-level partitions, no regex
+    if '```' in text:
+        _, _, rest = text.partition('```')
+        body, closed, _ = rest.partition('```')
+        if closed:
+            if body.startswith('json'):
+                body = body[4:]
+            text = body.strip()
+            if text.startswith('{') and text.endswith('}'):
+                return text
 
     # Try to find JSON object
-    # Look for { ... } pattern
-    json_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-    matches = list(re.finditer(json_pattern, text, re.DOTALL))
-
-    if matches:
-        # Find the largest match (most complete JSON)
-        largest = max(matches, key=lambda m: len(m.group(0)))
-        text = largest.group(0)
-    elif '{' in text and '}' in text:
-        # Extract from first { to last }
-        start = text.find('{')
-        end = text.rfind('}') + 1
-        if start < end:
-            text = text[start:end]
-    else:
+    # Look for the first balanced top-level { ... } span
+    span = _find_top_level_object(text)
+    if span is None:
         return None
 
-    return text.strip()
+    return text[span[0]:span[1]]
+
+
+def _find_top_level_object(text: str) -> tuple[int, int] | None:
+    """Locate the first balanced top-level JSON object in text.
+
+    Scans once from the first ``{``, tracking brace depth and string/escape
+    state so braces inside string values are ignored.
+
+    Args:
+        text: Text that may contain a JSON object
+
+    Returns:
+        (start, end) slice bounds of the object, or None if no object closes
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escape = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escape:
+                escape = False
+            elif char == '\\':
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return start, index + 1
+
+    return None
+
+
+def _is_fixable_json_error(error: json.JSONDecodeError) -> bool:
+    """Check whether a decode error is a class _try_fix_json can repair.
+
+    Args:
+        error: Error raised while parsing the cleaned response
+
+    Returns:
+        False for unrepairable errors, True otherwise
+    """
+    if error.pos == 0 or error.msg.startswith(_UNFIXABLE_JSON_ERRORS):
+        logger.debug(f"Skipping JSON repair for unfixable error: {error.msg}")
+        return False
+    return True
 
 
 def _try_fix_json(json_str: str) -> str | None:
@@ -396,21 +644,18 @@ def _try_fix_json(json_str: str) -> str | None:
     fixed = json_str
 
     # Fix trailing commas
-    fixed = re.sub(r',\s*}', '}', fixed)
-    fixed = re.sub(r',\s*]', ']', fixed)
+    fixed = _TRAILING_COMMA_RE.sub(r'\1', fixed)
 
     # Fix single quotes to double quotes (but be careful with content)
     # Only replace quotes around keys
-    fixed = re.sub(r"'(\w+)':", r'"\1":', fixed)
+    fixed = _SINGLE_QUOTE_KEY_RE.sub(r'"\1":', fixed)
 
     # Fix missing quotes around string values
     # This is risky so we do it conservatively
-    fixed = re.sub(r':\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*([,}\]])', r': "\1"\2', fixed)
+    fixed = _BAREWORD_VALUE_RE.sub(r': "\1"\2', fixed)
 
     # Fix boolean values
-    fixed = re.sub(r'\bTrue\b', 'true', fixed)
-    fixed = re.sub(r'\bFalse\b', 'false', fixed)
-    fixed = re.sub(r'\bNone\b', 'null', fixed)
+    fixed = _PY_LITERALS_RE.sub(lambda m: _PY_LITERALS[m.group(1)], fixed)
 
     return fixed
 
@@ -439,7 +684,9 @@ def extract_theme_requirements_from_json(spec: ThemeSpecification) -> dict[str,
         "integrations": [],
         "design_profile": {
             "name": "custom",
-            "colors": spec.colors.model_dump(),
+            # ColorScheme is flat, so a shallow dict() matches model_dump() without
+            # running the serializer; all keys are kept since overrides iterate them
+            "colors": dict(spec.colors),
             "fonts": {
                 "primary": spec.typography.font_primary,
                 "headings": spec.typography.font_headings,
@@ -8,7 +8,7 @@ The JSON is then rendered through Jinja2 templates to produce valid PHP files.
 
 from enum import Enum
 from typing import Any, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 import re
 
 
@@ -252,6 +252,10 @@ def get_default_theme_spec() -> ThemeSpecification:
     )
 
 
+# Validator built once and reused; avoids the **data kwargs round trip per call
+_THEME_ADAPTER = TypeAdapter(ThemeSpecification)
+
+
 def validate_theme_spec(data: dict) -> tuple[bool, list[str], ThemeSpecification | None]:
     """Validate theme specification JSON against the schema.
 
@@ -265,7 +269,7 @@ def validate_theme_spec(data: dict) -> tuple[bool, list[str], ThemeSpecification
 
     try:
         # Attempt to parse with Pydantic
-        spec = ThemeSpecification(**data)
+        spec = _THEME_ADAPTER.validate_python(data)
         return True, [], spec
 
     except Exception as e:
@@ -281,7 +285,7 @@ def validate_theme_spec(data: dict) -> tuple[bool, list[str], ThemeSpecification
             if 'theme_display_name' not in data:
                 data['theme_display_name'] = 'WPGen Theme'
 
-            spec = ThemeSpecification(**data)
+            spec = _THEME_ADAPTER.validate_python(data)
             errors.append("Used default values for missing fields")
             return True, errors, spec
 
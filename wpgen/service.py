@@ -10,28 +10,108 @@ The default generator is now the HybridWordPressGenerator which uses:
 3. Guaranteed syntax-correct output with no hallucinated functions
 """
 
+import functools
+import hashlib
+import json
+import logging
 import os
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
-from .generators import WordPressGenerator, HybridWordPressGenerator
+from .blueprints import get_blueprint
+from .design_profiles import get_design_profile, get_profile_names
+from .generators import HybridWordPressGenerator, WordPressGenerator
 from .github import GitHubIntegration
+from .optimizer import PromptOptimizer
 from .parsers import PromptParser
 from .utils import get_llm_provider, get_logger
+from .utils.code_validator import CodeValidator
+from .utils.combined_validator import validate_directory
 from .utils.image_analysis import ImageAnalyzer
+from .utils.requirements_cache import RequirementsCache
 from .utils.text_utils import TextProcessor
-from .utils.code_validator import CodeValidator
 from .utils.theme_validator import ThemeValidator
 from .wordpress import WordPressAPI
-from .design_profiles import get_design_profile, get_profile_names
-from .optimizer import PromptOptimizer
-from .blueprints import get_blueprint
 
 logger = get_logger(__name__)
 
+# Seconds a successful WordPress connection test is trusted for repeat deploys
+_WP_PROBE_TTL = 60
+
+# Last successful connection test per (site_url, username). Module level so the
+# per-call services built by generate_theme() share it.
+_WP_PROBES: dict[tuple[str, str], float] = {}
+_WP_PROBE_LOCK = threading.Lock()
+
+# LLM providers reused across requests, keyed by a digest of the effective LLM
+# config (so API keys are never stored in the key) and kept in LRU order
+_PROVIDER_CACHE_SIZE = 8
+_PROVIDERS: OrderedDict[str, Any] = OrderedDict()
+_PROVIDER_LOCK = threading.Lock()
+
+# Characters of each uploaded document included in the prompt
+_MAX_DOCUMENT_CHARS = 2000
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_validator(validator_cls: type, strict: bool) -> Any:
+    """Return a process-wide validator instance for a strictness level.
+
+    Validator construction shells out to ``php --version`` to probe for PHP,
+    so instances are built once and reused; they hold no per-run state.
+
+    Args:
+        validator_cls: CodeValidator or ThemeValidator
+        strict: Whether the validator runs in strict mode
+
+    Returns:
+        Validator instance
+    """
+    return validator_cls(strict=strict)
+
+
+def _path_key(path: str) -> str:
+    """Normalize a path the way os.scandir() reports entries of its parent.
+
+    Args:
+        path: File path as given in a request
+
+    Returns:
+        Path string comparable with DirEntry.path
+    """
+    candidate = Path(path)
+    return os.path.join(str(candidate.parent), candidate.name)
+
+
+def _existing_paths(paths: list[str]) -> set[str]:
+    """Check which paths exist with one directory listing per parent.
+
+    Uploads usually share a directory, so listing each distinct parent once
+    replaces a stat() per file (costly on network filesystems).
+
+    Args:
+        paths: File paths to check
+
+    Returns:
+        Set of _path_key() values for the paths that exist
+    """
+    existing: set[str] = set()
+    for parent in {str(Path(path).parent) for path in paths}:
+        try:
+            with os.scandir(parent) as entries:
+                existing.update(entry.path for entry in entries)
+        except OSError:
+            continue
+    return existing
+
 
 class LLMProvider(str, Enum):
     """Supported LLM providers."""
@@ -50,6 +130,8 @@ class GeneratorType(str, Enum):
 class GenerationRequest(BaseModel):
     """Request model for theme generation."""
 
+    model_config = ConfigDict(validate_assignment=False, extra="ignore", str_strip_whitespace=True)
+
     # Core input
     prompt: str = Field(..., min_length=10, description="Natural language description of the WordPress site")
 
@@ -94,18 +176,12 @@ class GenerationRequest(BaseModel):
     # Validation options
     strict_validation: bool = Field(default=False, description="Fail on validation warnings")
 
-    @field_validator('prompt')
-    @classmethod
-    def validate_prompt(cls, v: str) -> str:
-        """Ensure prompt is not empty."""
-        if not v or not v.strip():
-            raise ValueError("Prompt cannot be empty")
-        return v.strip()
-
 
 class GenerationResult(BaseModel):
     """Result model for theme generation."""
 
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
     success: bool = Field(..., description="Whether generation succeeded")
     theme_dir: str | None = Field(default=None, description="Path to generated theme directory")
     theme_name: str = Field(..., description="Generated theme name")
@@ -141,6 +217,8 @@ class ThemeGenerationService:
         """
         self.config = config
         self.logger = logger
+        self._requirements_cache: RequirementsCache | None = None
+        self._semantic_cache = None
 
     def generate_theme(self, request: GenerationRequest) -> GenerationResult:
         """Generate a WordPress theme from a request.
@@ -153,13 +231,14 @@ class ThemeGenerationService:
         """
         try:
             self.logger.info("Starting theme generation")
-            self.logger.debug(f"Request: {request.model_dump()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Request: %s", request.model_dump_json())
 
             # Apply request overrides to config
             cfg = self._apply_request_overrides(request)
 
             # Initialize LLM provider
-            llm_provider = get_llm_provider(cfg)
+            llm_provider = self._get_llm_provider(cfg)
             provider_name = cfg.get("llm", {}).get("provider", "openai")
             self.logger.info(f"Initialized LLM provider: {provider_name}")
 
@@ -180,7 +259,9 @@ class ThemeGenerationService:
             # Parse optimized prompt to extract requirements
             self.logger.info("Parsing optimized prompt to extract requirements")
             parser = PromptParser(llm_provider)
-            requirements = parser.parse(optimization_result.optimized_prompt)
+            requirements = self._parse_requirements(
+                parser, optimization_result.optimized_prompt, cfg, provider_name
+            )
 
             # Inject blueprint requirements into the requirements dict
             requirements['_blueprint_name'] = optimization_result.blueprint_name
@@ -213,7 +294,8 @@ class ThemeGenerationService:
                 # Prepare images for hybrid generator
                 images = None
                 if request.image_files:
-                    images = [{"path": p} for p in request.image_files if Path(p).exists()]
+                    existing = _existing_paths(request.image_files)
+                    images = [{"path": p} for p in request.image_files if _path_key(p) in existing]
 
                 # Store original prompt for hybrid generator
                 requirements["original_prompt"] = request.prompt
@@ -234,7 +316,8 @@ class ThemeGenerationService:
             self.logger.info(f"Theme generated: {theme_dir}")
 
             # Initialize result
-            result = GenerationResult(
+            # Every field is produced internally, so skip validation
+            result = GenerationResult.model_construct(
                 success=True,
                 theme_dir=str(theme_dir),
                 theme_name=requirements.get("theme_name", "unknown"),
@@ -243,8 +326,23 @@ class ThemeGenerationService:
                 features=requirements.get("features", []),
             )
 
-            # Validate theme
-            validation_result = self._validate_theme(theme_dir, request.strict_validation)
+            publishing = request.push_to_github or request.deploy_to_wordpress
+            if request.strict_validation or not publishing:
+                # Validate theme; in strict mode it gates publishing
+                validation_result = self._validate_theme(theme_dir, request.strict_validation)
+                github_result = wp_result = None
+            else:
+                # Validators only read the theme directory, so hide their
+                # latency under the push/deploy network round trips
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    validation_future = executor.submit(
+                        self._validate_theme, theme_dir, request.strict_validation
+                    )
+                    github_result, wp_result = self._publish_theme(
+                        theme_dir, request, requirements, cfg
+                    )
+                    validation_result = validation_future.result()
+
             result.validation_errors = validation_result.get("errors", [])
             result.validation_warnings = validation_result.get("warnings", [])
 
@@ -255,16 +353,18 @@ class ThemeGenerationService:
                 result.error_details = f"Errors: {len(result.validation_errors)}, Warnings: {len(result.validation_warnings)}"
                 return result
 
-            # Push to GitHub if requested
-            if request.push_to_github:
-                github_result = self._push_to_github(theme_dir, request, requirements, cfg)
+            # Push to GitHub and/or deploy to WordPress if requested
+            if request.strict_validation and publishing:
+                github_result, wp_result = self._publish_theme(
+                    theme_dir, request, requirements, cfg
+                )
+
+            if github_result is not None:
                 result.github_url = github_result.get("url")
                 if not github_result.get("success"):
                     self.logger.warning(f"GitHub push failed: {github_result.get('error')}")
 
-            # Deploy to WordPress if requested
-            if request.deploy_to_wordpress:
-                wp_result = self._deploy_to_wordpress(theme_dir, request, requirements, cfg)
+            if wp_result is not None:
                 result.wordpress_deployed = wp_result.get("deployed", False)
                 result.wordpress_activated = wp_result.get("activated", False)
                 result.wordpress_theme_id = wp_result.get("theme_id")
@@ -276,15 +376,42 @@ class ThemeGenerationService:
 
         except Exception as e:
             self.logger.error(f"Theme generation failed: {e}", exc_info=True)
-            return GenerationResult(
+            return GenerationResult.model_construct(
                 success=False,
                 theme_name="error",
                 theme_display_name="Error",
                 description="",
                 error=str(e),
-                error_details=repr(e),
+                error_details="".join(traceback.format_exception_only(type(e), e))[:4096],
             )
 
+    def _get_llm_provider(self, cfg: dict[str, Any]):
+        """Return a provider for the effective LLM config, reusing earlier ones.
+
+        Provider construction sets up SDK clients and HTTP sessions, so the
+        most recently used providers are kept at module level and shared by
+        every service instance, including the per-call ones generate_theme()
+        builds.
+
+        Args:
+            cfg: Configuration with request overrides applied
+
+        Returns:
+            LLM provider instance
+        """
+        llm_config = json.dumps(cfg.get("llm", {}), sort_keys=True, default=str)
+        key = hashlib.sha256(llm_config.encode("utf-8")).hexdigest()
+        with _PROVIDER_LOCK:
+            provider = _PROVIDERS.get(key)
+            if provider is None:
+                provider = get_llm_provider(cfg)
+                _PROVIDERS[key] = provider
+                if len(_PROVIDERS) > _PROVIDER_CACHE_SIZE:
+                    _PROVIDERS.popitem(last=False)
+            else:
+                _PROVIDERS.move_to_end(key)
+        return provider
+
     def _apply_request_overrides(self, request: GenerationRequest) -> Dict[str, Any]:
         """Apply request parameters as overrides to config.
 
@@ -294,43 +421,187 @@ class ThemeGenerationService:
         Returns:
             Modified configuration dictionary
         """
-        cfg = self.config.copy()
+        # Copy-on-write: clone only the branches an override touches, so
+        # per-request changes never leak into the shared self.config
+        cfg = dict(self.config)
+        llm_overrides = (
+            request.llm_provider
+            or request.llm_model
+            or request.llm_brains_model
+            or request.llm_brains_base_url
+            or request.llm_vision_model
+            or request.llm_vision_base_url
+        )
+        if not llm_overrides:
+            return cfg
+
+        cfg["llm"] = dict(cfg.get("llm") or {})
 
         # Override LLM provider
         if request.llm_provider:
-            if "llm" not in cfg:
-                cfg["llm"] = {}
             cfg["llm"]["provider"] = request.llm_provider.value
 
         # Override LLM model
         if request.llm_model:
-            if "llm" not in cfg:
-                cfg["llm"] = {}
             cfg["llm"]["model"] = request.llm_model
 
         # Override local LLM models
-        if request.llm_brains_model or request.llm_brains_base_url:
-            provider = cfg.get("llm", {}).get("provider", "")
-            if provider in ["local-lmstudio", "local-ollama"]:
-                if provider not in cfg["llm"]:
-                    cfg["llm"][provider] = {}
-                if request.llm_brains_model:
-                    cfg["llm"][provider]["brains_model"] = request.llm_brains_model
-                if request.llm_brains_base_url:
-                    cfg["llm"][provider]["brains_base_url"] = request.llm_brains_base_url
-
-        if request.llm_vision_model or request.llm_vision_base_url:
-            provider = cfg.get("llm", {}).get("provider", "")
-            if provider in ["local-lmstudio", "local-ollama"]:
-                if provider not in cfg["llm"]:
-                    cfg["llm"][provider] = {}
-                if request.llm_vision_model:
-                    cfg["llm"][provider]["vision_model"] = request.llm_vision_model
-                if request.llm_vision_base_url:
-                    cfg["llm"][provider]["vision_base_url"] = request.llm_vision_base_url
+        provider = cfg["llm"].get("provider", "")
+        if provider in ["local-lmstudio", "local-ollama"]:
+            local_overrides = {
+                "brains_model": request.llm_brains_model,
+                "brains_base_url": request.llm_brains_base_url,
+                "vision_model": request.llm_vision_model,
+                "vision_base_url": request.llm_vision_base_url,
+            }
+            local_overrides = {key: value for key, value in local_overrides.items() if value}
+            if local_overrides:
+                cfg["llm"][provider] = {**(cfg["llm"].get(provider) or {}), **local_overrides}
 
         return cfg
 
+    def _parse_requirements(
+        self,
+        parser: PromptParser,
+        prompt: str,
+        cfg: dict[str, Any],
+        provider_name: str,
+    ) -> Dict[str, Any]:
+        """Parse a prompt, reusing cached requirements for identical or similar requests.
+
+        Args:
+            parser: Prompt parser bound to the active provider
+            prompt: Prompt to parse
+            cfg: Configuration with request overrides applied
+            provider_name: Active LLM provider name
+
+        Returns:
+            Requirements dictionary
+        """
+        cache = self._get_requirements_cache(cfg)
+        if cache is None:
+            return parser.parse(prompt)
+
+        llm_cfg = cfg.get("llm", {})
+        provider_cfg = llm_cfg.get(provider_name, {}) or {}
+        model = (
+            llm_cfg.get("model")
+            or provider_cfg.get("model")
+            or provider_cfg.get("brains_model")
+            or ""
+        )
+        key = RequirementsCache.make_key(provider_name, model, prompt)
+
+        requirements = cache.get(key)
+        if requirements is not None:
+            self.logger.info("Using cached requirements for identical prompt")
+            return requirements
+
+        # Paraphrase reuse only makes sense when sampling is near-deterministic
+        temperature = float(provider_cfg.get("temperature", llm_cfg.get("temperature", 0.4)))
+        semantic_cache = self._get_semantic_cache(cfg, temperature)
+        scope = f"{provider_name}|{model}"
+        embedding = None
+        if semantic_cache is not None:
+            try:
+                embedding = semantic_cache.embed(prompt)
+                requirements = semantic_cache.get(scope, embedding)
+            except Exception as e:
+                self.logger.warning(f"Semantic cache lookup failed: {e}")
+            if requirements is not None:
+                self.logger.info("Using cached requirements for similar prompt")
+                return requirements
+
+        requirements, parsed = parser.parse_with_status(prompt)
+        if not parsed:
+            # Never persist the generic fallback; a retry should reach the LLM again
+            return requirements
+        try:
+            cache.set(key, requirements)
+            if embedding is not None:
+                semantic_cache.set(scope, embedding, requirements)
+        except Exception as e:
+            self.logger.warning(f"Could not cache parsed requirements: {e}")
+        return requirements
+
+    def _get_requirements_cache(self, cfg: dict[str, Any]) -> RequirementsCache | None:
+        """Open the requirements cache if enabled in config.
+
+        Args:
+            cfg: Configuration with request overrides applied
+
+        Returns:
+            RequirementsCache instance, or None when caching is disabled
+        """
+        cache_cfg = cfg.get("cache", {}) or {}
+        if not cache_cfg.get("enabled", False):
+            return None
+
+        db_path = self._requirements_cache_path(cfg)
+        if self._requirements_cache is None or self._requirements_cache.db_path != db_path:
+            try:
+                self._requirements_cache = RequirementsCache(
+                    db_path, ttl_seconds=cache_cfg.get("ttl_seconds", 86400)
+                )
+            except Exception as e:
+                self.logger.warning(f"Requirements cache unavailable: {e}")
+                return None
+        return self._requirements_cache
+
+    def _get_semantic_cache(self, cfg: dict[str, Any], temperature: float):
+        """Open the semantic requirements cache if enabled and applicable.
+
+        Args:
+            cfg: Configuration with request overrides applied
+            temperature: Sampling temperature of the active model
+
+        Returns:
+            SemanticRequirementsCache instance, or None when disabled, unavailable,
+            or the temperature is above semantic_max_temperature
+        """
+        cache_cfg = cfg.get("cache", {}) or {}
+        if not cache_cfg.get("semantic", False):
+            return None
+        if temperature > cache_cfg.get("semantic_max_temperature", 0.3):
+            return None
+
+        db_path = self._requirements_cache_path(cfg)
+        if self._semantic_cache is None or self._semantic_cache.db_path != db_path:
+            try:
+                from .utils.semantic_cache import SemanticRequirementsCache
+
+                self._semantic_cache = SemanticRequirementsCache(
+                    db_path,
+                    threshold=cache_cfg.get("semantic_threshold", 0.92),
+                    ttl_seconds=cache_cfg.get("ttl_seconds", 86400),
+                )
+            except ImportError:
+                self.logger.warning(
+                    "Semantic cache requires sentence-transformers; "
+                    "install it or disable cache.semantic"
+                )
+                return None
+            except Exception as e:
+                self.logger.warning(f"Semantic cache unavailable: {e}")
+                return None
+        return self._semantic_cache
+
+    @staticmethod
+    def _requirements_cache_path(cfg: dict[str, Any]) -> Path:
+        """Resolve the requirements cache database path.
+
+        Args:
+            cfg: Configuration with request overrides applied
+
+        Returns:
+            Path to the SQLite cache file
+        """
+        cache_cfg = cfg.get("cache", {}) or {}
+        return Path(
+            cache_cfg.get("path")
+            or Path(cfg.get("output", {}).get("output_dir", "output")) / "requirements.cache.db"
+        )
+
     def _enhance_prompt(self, request: GenerationRequest, llm_provider) -> str:
         """Enhance prompt with image and document analysis.
 
@@ -341,17 +612,30 @@ class ThemeGenerationService:
         Returns:
             Enhanced prompt string
         """
-        prompt = request.prompt
+        parts = [request.prompt]
+        existing = _existing_paths([*(request.image_files or []), *(request.text_files or [])])
 
-        # Analyze images if provided
+        # Image analyses (vision LLM calls) and document extraction are
+        # independent I/O-bound tasks, so fan each group out across threads;
+        # map() keeps results in input order
         if request.image_files:
             self.logger.info(f"Analyzing {len(request.image_files)} images")
             try:
                 analyzer = ImageAnalyzer(llm_provider)
-                for image_path in request.image_files:
-                    if Path(image_path).exists():
-                        analysis = analyzer.analyze_design_mockup(image_path)
-                        prompt += f"\n\nDesign Analysis:\n{analysis}"
+
+                def analyze(image_path: str) -> Any:
+                    if _path_key(image_path) not in existing:
+                        return None
+                    try:
+                        return analyzer.analyze_design_mockup(image_path)
+                    except Exception as e:
+                        self.logger.warning(f"Image analysis failed for {image_path}: {e}")
+                        return None
+
+                with ThreadPoolExecutor(max_workers=min(8, len(request.image_files))) as executor:
+                    for analysis in executor.map(analyze, request.image_files):
+                        if analysis is not None:
+                            parts.append(f"\n\nDesign Analysis:\n{analysis}")
             except Exception as e:
                 self.logger.warning(f"Image analysis failed: {e}")
 
@@ -360,14 +644,24 @@ class ThemeGenerationService:
             self.logger.info(f"Processing {len(request.text_files)} documents")
             try:
                 processor = TextProcessor()
-                for text_path in request.text_files:
-                    if Path(text_path).exists():
-                        content = processor.extract_text(text_path)
-                        prompt += f"\n\nDocument Content:\n{content[:2000]}"  # Limit to 2000 chars
+
+                def extract(text_path: str) -> str | None:
+                    if _path_key(text_path) not in existing:
+                        return None
+                    try:
+                        return processor.extract_text(text_path, max_chars=_MAX_DOCUMENT_CHARS)
+                    except Exception as e:
+                        self.logger.warning(f"Document processing failed for {text_path}: {e}")
+                        return None
+
+                with ThreadPoolExecutor(max_workers=min(8, len(request.text_files))) as executor:
+                    for content in executor.map(extract, request.text_files):
+                        if content is not None:
+                            parts.append(f"\n\nDocument Content:\n{content}")
             except Exception as e:
                 self.logger.warning(f"Document processing failed: {e}")
 
-        return prompt
+        return "".join(parts)
 
     def _apply_design_profile(self, requirements: dict[str, Any], profile_name: str) -> Dict[str, Any]:
         """Apply design profile to requirements.
@@ -409,7 +703,7 @@ class ThemeGenerationService:
         Returns:
             Modified requirements dictionary
         """
-        self.logger.info(f"Applying optional features: {optional_features}")
+        self.logger.info("Applying optional features: %s", optional_features)
         requirements["optional_features"] = optional_features
         return requirements
 
@@ -428,17 +722,14 @@ class ThemeGenerationService:
         warnings = []
 
         try:
-            # Validate code
-            code_validator = CodeValidator(strict=strict)
-            code_results = code_validator.validate_directory(theme_dir)
-            errors.extend(code_results.get("errors", []))
-            warnings.extend(code_results.get("warnings", []))
-
-            # Validate theme structure
-            theme_validator = ThemeValidator(strict=strict)
-            theme_results = theme_validator.validate(theme_dir)
-            errors.extend(theme_results.get("errors", []))
-            warnings.extend(theme_results.get("warnings", []))
+            # Validate code and theme structure from a single directory walk
+            combined_results = validate_directory(
+                theme_dir,
+                code_validator=_shared_validator(CodeValidator, strict),
+                theme_validator=_shared_validator(ThemeValidator, strict),
+            )
+            errors.extend(combined_results["errors"])
+            warnings.extend(combined_results["warnings"])
 
         except Exception as e:
             self.logger.warning(f"Validation failed: {e}")
@@ -449,6 +740,44 @@ class ThemeGenerationService:
 
         return {"errors": errors, "warnings": warnings}
 
+    def _publish_theme(
+        self,
+        theme_dir: str,
+        request: GenerationRequest,
+        requirements: dict[str, Any],
+        cfg: dict[str, Any],
+    ) -> tuple[Dict[str, Any] | None, Dict[str, Any] | None]:
+        """Push the theme to GitHub and deploy it to WordPress as requested.
+
+        Both steps are network-bound and independent, so when both are
+        requested they run concurrently.
+
+        Args:
+            theme_dir: Path to theme directory
+            request: Generation request
+            requirements: Theme requirements
+            cfg: Configuration
+
+        Returns:
+            Tuple of (github_result, wordpress_result); None for steps not requested
+        """
+        if request.push_to_github and request.deploy_to_wordpress:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                github_future = executor.submit(
+                    self._push_to_github, theme_dir, request, requirements, cfg
+                )
+                wp_future = executor.submit(
+                    self._deploy_to_wordpress, theme_dir, request, requirements, cfg
+                )
+                return github_future.result(), wp_future.result()
+
+        github_result = wp_result = None
+        if request.push_to_github:
+            github_result = self._push_to_github(theme_dir, request, requirements, cfg)
+        if request.deploy_to_wordpress:
+            wp_result = self._deploy_to_wordpress(theme_dir, request, requirements, cfg)
+        return github_result, wp_result
+
     def _push_to_github(self, theme_dir: str, request: GenerationRequest, requirements: dict[str, Any], cfg: dict[str, Any]) -> Dict[str, Any]:
         """Push theme to GitHub.
 
@@ -494,6 +823,7 @@ class ThemeGenerationService:
         Returns:
             Dictionary with deployment results
         """
+        probe_key = None
         try:
             wp_config = cfg.get("wordpress_api", {})
             site_url = os.getenv("WP_SITE_URL") or wp_config.get("site_url")
@@ -506,38 +836,56 @@ class ThemeGenerationService:
             self.logger.info(f"Deploying theme to WordPress: {site_url}")
             wp_api = WordPressAPI(site_url, username, password)
 
-            # Test connection
-            if not wp_api.test_connection():
-                return {"success": False, "error": "WordPress connection test failed"}
-
-            # Create theme ZIP
-            from .utils.file_handler import FileHandler
-            file_handler = FileHandler()
-            zip_path = file_handler.create_zip(theme_dir)
-
-            # Upload theme
-            theme_id = wp_api.upload_theme(zip_path)
-            self.logger.info(f"Theme uploaded: {theme_id}")
+            # Test connection, unless this site passed a probe moments ago
+            probe_key = (site_url, username)
+            with _WP_PROBE_LOCK:
+                last_probe = _WP_PROBES.get(probe_key)
+            if last_probe is None or time.monotonic() - last_probe >= _WP_PROBE_TTL:
+                if not wp_api.test_connection():
+                    _forget_wp_probe(probe_key)
+                    return {"success": False, "error": "WordPress connection test failed"}
+                with _WP_PROBE_LOCK:
+                    _WP_PROBES[probe_key] = time.monotonic()
+
+            # Package the theme; the REST API has no theme upload endpoint, so
+            # deploy_theme() returns the ZIP plus manual install instructions
+            deployment = wp_api.deploy_theme(theme_dir)
+            self.logger.info(f"Theme packaged for deployment: {deployment.get('zip_path')}")
 
             # Activate if requested
-            activated = False
-            if request.wordpress_activate:
-                wp_api.activate_theme(requirements["theme_name"])
-                activated = True
-                self.logger.info("Theme activated")
+            activated = bool(deployment.get("activated", False))
+            if request.wordpress_activate and not activated:
+                activation = wp_api.activate_theme(requirements["theme_name"])
+                activated = bool(activation.get("success", False))
+                if activated:
+                    self.logger.info("Theme activated")
 
             return {
-                "success": True,
-                "deployed": True,
+                "success": bool(deployment.get("success", False)),
+                "deployed": bool(deployment.get("success", False)),
                 "activated": activated,
-                "theme_id": theme_id,
+                "theme_id": deployment.get("theme_name"),
+                "zip_path": deployment.get("zip_path"),
+                "instructions": deployment.get("instructions", []),
             }
 
         except Exception as e:
             self.logger.error(f"WordPress deployment failed: {e}")
+            # Re-probe next time rather than trusting a possibly stale success
+            _forget_wp_probe(probe_key)
             return {"success": False, "error": str(e)}
 
 
+def _forget_wp_probe(probe_key: tuple[str, str] | None) -> None:
+    """Drop a cached WordPress connection probe.
+
+    Args:
+        probe_key: (site_url, username) of the probed site, or None
+    """
+    with _WP_PROBE_LOCK:
+        _WP_PROBES.pop(probe_key, None)
+
+
 # Convenience function for simple usage
 def generate_theme(config: dict[str, Any], request: GenerationRequest) -> GenerationResult:
     """Generate a WordPress theme (convenience function).
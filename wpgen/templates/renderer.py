@@ -36,18 +36,35 @@ The LLM never outputs PHP directly - it outputs JSON which is rendered
 through these safe, pre-validated templates.
 """
 
+import functools
+import hashlib
+import io
 import os
 import re
 import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    TemplateNotFound,
+)
 
 from ..schema import ThemeSpecification, get_default_theme_spec
 from ..utils.logger import get_logger
 
+try:
+    from PIL import Image, ImageDraw, ImageFilter, ImageFont
+except ImportError:  # pragma: no cover
+    Image = ImageDraw = ImageFilter = ImageFont = None
+
 logger = get_logger(__name__)
 
 
@@ -56,6 +73,7 @@ TEMPLATE_DIR = Path(__file__).parent
 PHP_TEMPLATE_DIR = TEMPLATE_DIR / "php"
 PHP_FALLBACK_DIR = PHP_TEMPLATE_DIR / "fallback"
 JS_TEMPLATE_DIR = TEMPLATE_DIR / "js"
+MISC_TEMPLATE_DIR = TEMPLATE_DIR / "misc"
 
 
 # WordPress template files to generate
@@ -81,6 +99,51 @@ JS_TEMPLATES = {
     "assets/js/navigation.js": "navigation.js.j2",
 }
 
+# Static files written into every theme, encoded once at import
+_GITIGNORE_BYTES = b"""# IDE
+.idea/
+.vscode/
+*.swp
+*.swo
+
+# OS
+.DS_Store
+Thumbs.db
+
+# Node
+node_modules/
+
+# Build
+dist/
+build/
+
+# Logs
+*.log
+"""
+
+_EDITOR_STYLE_BYTES = b"""/* Editor styles for Gutenberg blocks */
+.editor-styles-wrapper {
+    font-family: inherit;
+}
+"""
+
+# Threads used to render and write template outputs concurrently
+_RENDER_WORKERS = 8
+
+# Patterns used by sanitize_filename() and sanitize_theme_slug()
+_RE_SPACE_UNDERSCORE = re.compile(r'[\s_]+')
+_RE_FILENAME_INVALID = re.compile(r'[^a-z0-9\-.]')
+_RE_SLUG_INVALID = re.compile(r'[^a-z0-9-]')
+_RE_DASHES = re.compile(r'-+')
+
+# Leaf directories created in every theme
+THEME_SUBDIRECTORIES = (
+    "assets/css",
+    "assets/js",
+    "assets/images",
+    "template-parts",
+)
+
 # Templates that are ALWAYS rendered from fallback (hard-locked, never LLM-generated)
 # These templates are too critical to allow LLM generation - they MUST be stable
 HARD_LOCKED_TEMPLATES = {
@@ -119,11 +182,174 @@ REQUIRED_TEMPLATES = {
 }
 
 
+class _LazyBytecodeCache(FileSystemBytecodeCache):
+    """FileSystemBytecodeCache that creates its directory on first write.
+
+    Nothing touches the filesystem until a template is compiled. If the
+    directory cannot be created or written, the cache turns itself off and
+    templates are compiled in memory as usual.
+    """
+
+    def __init__(self, directory: Path):
+        """Remember the cache directory without creating it.
+
+        Args:
+            directory: Directory for the compiled template files
+        """
+        super().__init__(directory=str(directory), pattern="%s.cache")
+        self._usable: bool | None = None
+        self._lock = threading.Lock()
+
+    def _disable(self, error: OSError) -> None:
+        logger.debug("Template bytecode cache disabled: %s", error)
+        self._usable = False
+
+    def _ensure_directory(self) -> bool:
+        """Create the cache directory once.
+
+        Returns:
+            True if the directory exists and the cache is still enabled
+        """
+        if self._usable is None:
+            with self._lock:
+                if self._usable is None:
+                    try:
+                        os.makedirs(self.directory, exist_ok=True)
+                        self._usable = True
+                    except OSError as e:
+                        self._disable(e)
+        return self._usable
+
+    def load_bytecode(self, bucket) -> None:
+        if self._usable is False:
+            return
+        try:
+            super().load_bytecode(bucket)
+        except OSError as e:
+            self._disable(e)
+
+    def dump_bytecode(self, bucket) -> None:
+        if not self._ensure_directory():
+            return
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            self._disable(e)
+
+
+def _make_bytecode_cache() -> BytecodeCache | None:
+    """Create the on-disk cache for compiled template bytecode.
+
+    Compiled templates are kept under $XDG_CACHE_HOME/wpgen/jinja (default
+    ~/.cache/wpgen/jinja) so later processes skip parsing. WPGEN_JINJA_CACHE
+    overrides the directory; set WPGEN_NO_BCC=1 to disable the cache. The
+    directory is created when the first template is compiled, not here.
+
+    Returns:
+        Bytecode cache, or None if disabled
+    """
+    if os.environ.get("WPGEN_NO_BCC") == "1":
+        return None
+
+    cache_dir = os.environ.get("WPGEN_JINJA_CACHE")
+    if cache_dir:
+        return _LazyBytecodeCache(Path(cache_dir).expanduser())
+
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return _LazyBytecodeCache(cache_root / "wpgen" / "jinja")
+
+
+def _make_environment(template_dir: Path, bytecode_cache: BytecodeCache | None) -> Environment:
+    """Create a Jinja2 environment for one template directory.
+
+    Args:
+        template_dir: Directory the loader reads templates from
+        bytecode_cache: Shared bytecode cache, or None
+
+    Returns:
+        Configured Environment with an unbounded template cache. The bundled
+        templates do not change at runtime, so cached templates are never
+        re-checked against their source files.
+    """
+    return Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=False,  # Don't escape PHP code
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        cache_size=-1,
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+_BYTECODE_CACHE = _make_bytecode_cache()
+_PHP_ENV = _make_environment(PHP_TEMPLATE_DIR, _BYTECODE_CACHE)
+_JS_ENV = _make_environment(JS_TEMPLATE_DIR, _BYTECODE_CACHE)
+_FALLBACK_ENV = _make_environment(PHP_FALLBACK_DIR, _BYTECODE_CACHE)
+_MISC_ENV = _make_environment(MISC_TEMPLATE_DIR, _BYTECODE_CACHE)
+
+
+# Lint results keyed by a BLAKE2b digest of the file contents; re-rendering
+# identical PHP skips php -l entirely
+_PHP_LINT_CACHE: dict[str, bool] = {}
+_PHP_LINT_CACHE_MAX = 4096
+
+
+def _content_digest(file_path: Path) -> str | None:
+    """Fingerprint a file's contents for the lint cache.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest, or None if the file cannot be read
+    """
+    try:
+        return hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def _remember_lint_result(digest: str | None, valid: bool) -> None:
+    """Store a definitive lint result in the cache.
+
+    Args:
+        digest: Content digest from _content_digest()
+        valid: Lint result
+    """
+    if digest is None:
+        return
+    if len(_PHP_LINT_CACHE) >= _PHP_LINT_CACHE_MAX:
+        _PHP_LINT_CACHE.clear()
+    _PHP_LINT_CACHE[digest] = valid
+
+
 def validate_php_file(file_path: Path) -> bool:
     """Validate PHP syntax of a file using php -l.
 
+    Results are cached by file contents, so identical output is only linted
+    once per process.
+
+    Args:
+        file_path: Path to PHP file
+
+    Returns:
+        True if valid, False otherwise
+    """
+    digest = _content_digest(file_path)
+    cached = _PHP_LINT_CACHE.get(digest) if digest is not None else None
+    if cached is not None:
+        return cached
+    return _validate_uncached(file_path, digest)
+
+
+def _validate_uncached(file_path: Path, digest: str | None) -> bool:
+    """Lint a file that is not in the cache with php -l and record the result.
+
     Args:
         file_path: Path to PHP file
+        digest: Content digest used as the cache key
 
     Returns:
         True if valid, False otherwise
@@ -137,15 +363,113 @@ def validate_php_file(file_path: Path) -> bool:
             errors="replace",
             timeout=10,
         )
-        return result.returncode == 0
     except (FileNotFoundError, subprocess.TimeoutExpired) as e:
-        logger.warning(f"PHP validation unavailable: {e}")
+        logger.warning("PHP validation unavailable: %s", e)
         # If php is not available, assume valid (CI environments may not have PHP)
         return True
     except Exception as e:
-        logger.error(f"PHP validation error: {e}")
+        logger.error("PHP validation error: %s", e)
         return False
 
+    valid = result.returncode == 0
+    _remember_lint_result(digest, valid)
+    return valid
+
+
+@functools.lru_cache(maxsize=1)
+def _php_supports_multi_lint() -> bool:
+    """Check whether the installed PHP can lint several files in one call.
+
+    php -l accepts multiple files from PHP 8.3 onwards. The version is probed
+    once per process.
+
+    Returns:
+        True if PHP 8.3+ is available, False otherwise
+    """
+    try:
+        result = subprocess.run(
+            ["php", "-r", "echo PHP_VERSION_ID;"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        return result.returncode == 0 and int(result.stdout.strip()) >= 80300
+    except (OSError, subprocess.TimeoutExpired, ValueError):
+        return False
+
+
+def validate_php_files(file_paths: list[Path]) -> dict[Path, bool]:
+    """Validate PHP syntax of several files.
+
+    On PHP 8.3+ all files are passed to a single php -l call and the per-file
+    result lines are parsed. Older PHP versions lint the files concurrently,
+    one process per file.
+
+    Args:
+        file_paths: Paths to PHP files
+
+    Returns:
+        Mapping of each path to True if valid, False otherwise
+    """
+    results: dict[Path, bool] = {}
+    pending: dict[Path, str | None] = {}
+    for path in file_paths:
+        digest = _content_digest(path)
+        cached = _PHP_LINT_CACHE.get(digest) if digest is not None else None
+        if cached is None:
+            pending[path] = digest
+        else:
+            results[path] = cached
+
+    if not pending:
+        return results
+
+    if len(pending) == 1 or not _php_supports_multi_lint():
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            outcomes = executor.map(_validate_uncached, pending, pending.values())
+            results.update(zip(pending, outcomes))
+        return results
+
+    try:
+        result = subprocess.run(
+            ["php", "-l", *map(str, pending)],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=10 + len(pending),
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+        logger.warning("PHP validation unavailable: %s", e)
+        # If php is not available, assume valid (CI environments may not have PHP)
+        results.update(dict.fromkeys(pending, True))
+        return results
+    except Exception as e:
+        logger.error("PHP validation error: %s", e)
+        results.update(dict.fromkeys(pending, False))
+        return results
+
+    passed = set()
+    failed = set()
+    for line in result.stdout.splitlines():
+        if line.startswith("No syntax errors detected in "):
+            passed.add(line[len("No syntax errors detected in "):])
+        elif line.startswith("Errors parsing "):
+            failed.add(line[len("Errors parsing "):])
+
+    for path, digest in pending.items():
+        name = str(path)
+        if name in failed:
+            results[path] = False
+        elif name in passed:
+            results[path] = True
+        else:
+            # Unrecognized output for this file; lint it on its own
+            results[path] = _validate_uncached(path, digest)
+            continue
+        _remember_lint_result(digest, results[path])
+    return results
+
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize a filename for WordPress conventions.
@@ -160,13 +484,13 @@ def sanitize_filename(filename: str) -> str:
     filename = filename.lower()
 
     # Replace spaces and underscores with hyphens
-    filename = re.sub(r'[\s_]+', '-', filename)
+    filename = _RE_SPACE_UNDERSCORE.sub('-', filename)
 
     # Remove any character that isn't alphanumeric, hyphen, or dot
-    filename = re.sub(r'[^a-z0-9\-.]', '', filename)
+    filename = _RE_FILENAME_INVALID.sub('', filename)
 
     # Remove multiple consecutive hyphens
-    filename = re.sub(r'-+', '-', filename)
+    filename = _RE_DASHES.sub('-', filename)
 
     # Remove leading/trailing hyphens
     filename = filename.strip('-')
@@ -174,6 +498,13 @@ def sanitize_filename(filename: str) -> str:
     return filename
 
 
+# Sanitized output names never change, so compute them once at import
+_SANITIZED_PHP_OUTPUTS = {
+    output_file: sanitize_filename(output_file) for output_file in WORDPRESS_TEMPLATES
+}
+
+
+@functools.lru_cache(maxsize=256)
 def sanitize_theme_slug(slug: str) -> str:
     """Sanitize theme slug for WordPress.
 
@@ -187,13 +518,13 @@ def sanitize_theme_slug(slug: str) -> str:
     slug = slug.lower()
 
     # Replace spaces and underscores with hyphens
-    slug = re.sub(r'[\s_]+', '-', slug)
+    slug = _RE_SPACE_UNDERSCORE.sub('-', slug)
 
     # Remove any character that isn't alphanumeric or hyphen
-    slug = re.sub(r'[^a-z0-9-]', '', slug)
+    slug = _RE_SLUG_INVALID.sub('', slug)
 
     # Remove multiple consecutive hyphens
-    slug = re.sub(r'-+', '-', slug)
+    slug = _RE_DASHES.sub('-', slug)
 
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
@@ -205,6 +536,240 @@ def sanitize_theme_slug(slug: str) -> str:
     return slug
 
 
+@functools.lru_cache(maxsize=8)
+def _load_font(name: str, size: int):
+    """Load a TrueType font once per name and size.
+
+    Args:
+        name: Font file name
+        size: Point size
+
+    Returns:
+        FreeType font, or PIL's default font if the file cannot be loaded
+    """
+    try:
+        return ImageFont.truetype(name, size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=256)
+def _hex_to_rgb(value: str | None) -> tuple[int, int, int] | None:
+    """Convert a "#rrggbb" color to an RGB tuple.
+
+    Args:
+        value: Hex color string
+
+    Returns:
+        RGB tuple, or None if the value is not a valid six-digit hex color
+    """
+    if not value or not isinstance(value, str) or not value.startswith("#"):
+        return None
+    value = value.lstrip("#")
+    if len(value) != 6:
+        return None
+    try:
+        rgb = bytes.fromhex(value)
+    except ValueError:
+        return None
+    return tuple(rgb) if len(rgb) == 3 else None
+
+
+@functools.lru_cache(maxsize=32)
+def _placeholder_png(
+    colors: tuple[str | None, ...],
+    title: str,
+    subtitle: str,
+    cta_text: str,
+    secondary_text: str,
+) -> bytes:
+    """Draw the placeholder screenshot and encode it as PNG.
+
+    The image depends only on these arguments, so identical specs reuse the
+    encoded bytes instead of redrawing.
+
+    Args:
+        colors: Hex colors in order primary, secondary, accent, background,
+            surface, text_primary, text_secondary, border
+        title: Theme display name
+        subtitle: Font credit line
+        cta_text: Primary button label
+        secondary_text: Secondary button label
+
+    Returns:
+        PNG file contents
+    """
+    (
+        primary_hex,
+        secondary_hex,
+        accent_hex,
+        background_hex,
+        surface_hex,
+        text_primary_hex,
+        text_secondary_hex,
+        border_hex,
+    ) = colors
+
+    def _blend(color: tuple[int, int, int], other: tuple[int, int, int], ratio: float) -> tuple[int, int, int]:
+        return tuple(int(color[i] * (1 - ratio) + other[i] * ratio) for i in range(3))
+
+    primary = _hex_to_rgb(primary_hex) or (26, 26, 46)
+    secondary = _hex_to_rgb(secondary_hex) or _blend(primary, (255, 255, 255), 0.15)
+    accent = _hex_to_rgb(accent_hex) or _blend(primary, (255, 255, 255), 0.35)
+    background = _hex_to_rgb(background_hex) or (248, 250, 252)
+    surface = _hex_to_rgb(surface_hex) or (255, 255, 255)
+    text_primary = _hex_to_rgb(text_primary_hex) or (17, 24, 39)
+    text_secondary = _hex_to_rgb(text_secondary_hex) or (55, 65, 81)
+    border = _hex_to_rgb(border_hex) or (226, 232, 240)
+
+    img = Image.new("RGB", (1200, 900), background)
+    draw = ImageDraw.Draw(img)
+
+    hero_height = 360
+    # Build the vertical gradient as a 1px-wide column and stretch it in C,
+    # instead of drawing one line per row
+    gradient = bytes(
+        channel
+        for y in range(hero_height)
+        for channel in _blend(primary, secondary, y / max(hero_height - 1, 1))
+    )
+    hero = Image.frombytes("RGB", (1, hero_height), gradient).resize(
+        (1200, hero_height), Image.Resampling.NEAREST
+    )
+    img.paste(hero, (0, 0))
+
+    overlay = Image.new("RGBA", (1200, hero_height), (*accent, 30))
+    img.paste(overlay, (0, 0), overlay)
+
+    card_area_top = hero_height + 30
+    card_width = 320
+    card_height = 200
+    gap = 60
+    start_x = (1200 - (3 * card_width + 2 * gap)) // 2
+    shadow_color = (0, 0, 0, 60)
+    divider_color = _blend(border, accent, 0.15)
+
+    # Every card casts the same shadow, so blur it once and paste it three times
+    shadow = Image.new("RGBA", (card_width + 20, card_height + 20), (0, 0, 0, 0))
+    shadow_draw = ImageDraw.Draw(shadow)
+    shadow_draw.rectangle([10, 10, card_width + 10, card_height + 10], fill=shadow_color)
+    shadow = shadow.filter(ImageFilter.GaussianBlur(radius=8))
+
+    for i in range(3):
+        card_x = start_x + i * (card_width + gap)
+        card_y = card_area_top
+
+        img.paste(shadow, (card_x - 10, card_y - 6), shadow)
+
+        draw.rectangle(
+            [card_x, card_y, card_x + card_width, card_y + card_height],
+            fill=surface,
+            outline=border,
+            width=2,
+        )
+
+        draw.line(
+            [card_x, card_y + 72, card_x + card_width, card_y + 72],
+            fill=divider_color,
+            width=1,
+        )
+
+    font_title = _load_font("DejaVuSans-Bold.ttf", 64)
+    font_sub = _load_font("DejaVuSans.ttf", 30)
+    font_button = _load_font("DejaVuSans-Bold.ttf", 24)
+    font_small = _load_font("DejaVuSans.ttf", 20)
+
+    bbox = draw.textbbox((0, 0), title, font=font_title)
+    tw = bbox[2] - bbox[0]
+    draw.text(((1200 - tw) // 2, 120), title, fill=surface, font=font_title)
+
+    bbox2 = draw.textbbox((0, 0), subtitle, font=font_sub)
+    sw = bbox2[2] - bbox2[0]
+    draw.text(((1200 - sw) // 2, 200), subtitle, fill=_blend(surface, text_secondary, 0.1), font=font_sub)
+
+    cta_width = 280
+    cta_height = 64
+    cta_x = (1200 - cta_width) // 2
+    cta_y = 260
+    draw.rectangle([cta_x, cta_y, cta_x + cta_width, cta_y + cta_height], fill=accent, outline=_blend(accent, text_primary, 0.2), width=2)
+
+    bbox_cta = draw.textbbox((0, 0), cta_text, font=font_button)
+    draw.text(
+        (cta_x + (cta_width - (bbox_cta[2] - bbox_cta[0])) // 2, cta_y + (cta_height - (bbox_cta[3] - bbox_cta[1])) // 2),
+        cta_text,
+        fill=(255, 255, 255),
+        font=font_button,
+    )
+
+    secondary_cta_width = 200
+    secondary_cta_height = 54
+    secondary_cta_x = cta_x + cta_width + 24
+    secondary_cta_y = cta_y + 5
+    draw.rectangle(
+        [secondary_cta_x, secondary_cta_y, secondary_cta_x + secondary_cta_width, secondary_cta_y + secondary_cta_height],
+        fill=surface,
+        outline=border,
+        width=2,
+    )
+
+    bbox_secondary = draw.textbbox((0, 0), secondary_text, font=font_small)
+    draw.text(
+        (
+            secondary_cta_x + (secondary_cta_width - (bbox_secondary[2] - bbox_secondary[0])) // 2,
+            secondary_cta_y + (secondary_cta_height - (bbox_secondary[3] - bbox_secondary[1])) // 2,
+        ),
+        secondary_text,
+        fill=text_primary,
+        font=font_small,
+    )
+
+    caption = "Designed palette • Hero • Cards • CTA"
+    bbox_caption = draw.textbbox((0, 0), caption, font=font_small)
+    draw.text(
+        ((1200 - (bbox_caption[2] - bbox_caption[0])) // 2, card_area_top + card_height + 40),
+        caption,
+        fill=text_secondary,
+        font=font_small,
+    )
+
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+_EXCLUSIVE_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write every byte of data to an open file descriptor.
+
+    Args:
+        fd: File descriptor opened for writing
+        data: Bytes to write
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _write_bytes_fast(path: Path, data: bytes) -> None:
+    """Write bytes to a file with raw os-level calls.
+
+    Skips the buffered/text IO layers of open(), which dominate when a render
+    writes many small files.
+
+    Args:
+        path: Destination file (created or truncated)
+        data: File contents
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
 class ThemeRenderer:
     """Renderer for WordPress themes from JSON specifications.
 
@@ -220,34 +785,34 @@ class ThemeRenderer:
         """
         self.output_dir = Path(output_dir)
 
-        # Setup Jinja2 environment for PHP templates
-        self.php_env = Environment(
-            loader=FileSystemLoader(str(PHP_TEMPLATE_DIR)),
-            autoescape=False,  # Don't escape PHP code
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True,
-        )
-
-        # Setup Jinja2 environment for JS templates
-        self.js_env = Environment(
-            loader=FileSystemLoader(str(JS_TEMPLATE_DIR)),
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True,
-        )
+        # Environments are shared module-wide so compiled templates survive
+        # across renderer instances
+        self.php_env = _PHP_ENV
+        self.js_env = _JS_ENV
+        self.fallback_env = _FALLBACK_ENV
+        self.misc_env = _MISC_ENV
+
+        # Compile every template once up front, keyed by output file
+        self._php_templates: dict[str, Template] = {
+            output_file: self.php_env.get_template(template_file)
+            for output_file, template_file in WORDPRESS_TEMPLATES.items()
+        }
+        self._js_templates: dict[str, Template] = {
+            output_file: self.js_env.get_template(template_file)
+            for output_file, template_file in JS_TEMPLATES.items()
+        }
+        fallback_names = set(self.fallback_env.list_templates())
+        self._fallback_templates: dict[str, Template] = {
+            output_file: self.fallback_env.get_template(template_file)
+            for output_file, template_file in WORDPRESS_TEMPLATES.items()
+            if template_file in fallback_names
+        }
+        self._readme_template = self.misc_env.get_template("readme.md.j2")
 
-        # Setup Jinja2 environment for fallback templates
-        self.fallback_env = Environment(
-            loader=FileSystemLoader(str(PHP_FALLBACK_DIR)),
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True,
-        )
+        # Theme directories whose subdirectories this renderer already created
+        self._created_dirs: set[Path] = set()
 
-        logger.info(f"Initialized ThemeRenderer with output dir: {output_dir}")
+        logger.info("Initialized ThemeRenderer with output dir: %s", output_dir)
 
     def render(self, spec: ThemeSpecification, images: list[dict[str, Any]] | None = None) -> str:
         """Render a complete WordPress theme from a specification.
@@ -262,32 +827,20 @@ class ThemeRenderer:
         Raises:
             ValueError: If theme generation fails
         """
-        # Sanitize theme name for directory
+        # Sanitize theme name for directory; the spec itself is left untouched
         theme_slug = sanitize_theme_slug(spec.theme_name)
 
-        # Update spec with sanitized slug
-        spec.theme_name = theme_slug
-
-        logger.info(f"Rendering theme: {spec.theme_display_name} ({theme_slug})")
+        logger.info("Rendering theme: %s (%s)", spec.theme_display_name, theme_slug)
 
-        # Create theme directory
+        # Create theme directory and required subdirectories
         theme_dir = self.output_dir / theme_slug
-        theme_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create required directories
-        (theme_dir / "assets" / "css").mkdir(parents=True, exist_ok=True)
-        (theme_dir / "assets" / "js").mkdir(parents=True, exist_ok=True)
-        (theme_dir / "assets" / "images").mkdir(parents=True, exist_ok=True)
-        (theme_dir / "template-parts").mkdir(parents=True, exist_ok=True)
+        self._ensure_theme_dirs(theme_dir)
 
         # Prepare template context
-        context = self._prepare_context(spec)
+        context = self._prepare_context(spec, theme_slug)
 
-        # Render PHP templates
-        self._render_php_templates(theme_dir, context)
-
-        # Render JS templates
-        self._render_js_templates(theme_dir, context)
+        # Render PHP and JS templates
+        self._render_templates(theme_dir, context)
 
         # Generate additional files
         self._generate_additional_files(theme_dir, spec)
@@ -295,38 +848,58 @@ class ThemeRenderer:
         # Generate screenshot
         self._generate_screenshot(theme_dir, spec, images)
 
-        logger.info(f"Successfully rendered theme to: {theme_dir}")
+        logger.info("Successfully rendered theme to: %s", theme_dir)
 
         return str(theme_dir)
 
-    def _prepare_context(self, spec: ThemeSpecification) -> dict[str, Any]:
+    def _ensure_theme_dirs(self, theme_dir: Path) -> None:
+        """Create the theme directory tree, skipping trees created earlier.
+
+        Only the leaf directories are created; parents=True creates the theme
+        directory and assets/ along the way. A theme directory seen before
+        costs a single stat.
+
+        Args:
+            theme_dir: Theme directory path
+        """
+        if theme_dir in self._created_dirs and theme_dir.is_dir():
+            return
+
+        for subdir in THEME_SUBDIRECTORIES:
+            (theme_dir / subdir).mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(theme_dir)
+
+    def _prepare_context(
+        self, spec: ThemeSpecification, theme_slug: str | None = None
+    ) -> dict[str, Any]:
         """Prepare template context from specification.
 
         Args:
             spec: Theme specification
+            theme_slug: Sanitized theme slug (derived from spec.theme_name if None)
 
         Returns:
             Template context dictionary
         """
-        # Convert Pydantic model to dict for template access
-        spec_dict = spec.model_dump()
-
+        # Jinja resolves attribute access on the models directly, so the spec
+        # is not dumped to nested dicts first
         return {
-            "theme": spec_dict,
-            "colors": spec_dict["colors"],
-            "typography": spec_dict["typography"],
-            "layout": spec_dict["layout"],
-            "hero": spec_dict["hero"],
-            "navigation": spec_dict["navigation"],
-            "features": spec_dict["features"],
-            "widget_areas": spec_dict["widget_areas"],
-            "post_types": spec_dict["post_types"],
-            "tags": spec_dict["tags"],
-            "pages": spec_dict.get("pages", {}),
+            "theme": spec,
+            "theme_slug": theme_slug or sanitize_theme_slug(spec.theme_name),
+            "colors": spec.colors,
+            "typography": spec.typography,
+            "layout": spec.layout,
+            "hero": spec.hero,
+            "navigation": spec.navigation,
+            "features": spec.features,
+            "widget_areas": spec.widget_areas,
+            "post_types": spec.post_types,
+            "tags": spec.tags,
+            "pages": getattr(spec, "pages", {}),
         }
 
-    def _render_php_templates(self, theme_dir: Path, context: dict[str, Any]) -> None:
-        """Render all PHP templates with validation and fallback support.
+    def _render_templates(self, theme_dir: Path, context: dict[str, Any]) -> None:
+        """Render all PHP and JS templates with PHP validation and fallback support.
 
         CRITICAL RULES:
         1. Hard-locked templates (header.php) are ALWAYS rendered from fallback - NEVER from LLM
@@ -335,95 +908,144 @@ class ThemeRenderer:
         4. All required templates MUST be present in the final theme
         5. NO template may be omitted or replaced with placeholder/stub content
 
+        PHP and JS templates are rendered as one batch; the PHP outputs are then
+        validated together so php -l runs once per render instead of once per file.
+
         Args:
             theme_dir: Theme directory path
             context: Template context
         """
-        for output_file, template_file in WORDPRESS_TEMPLATES.items():
-            try:
-                output_path = theme_dir / sanitize_filename(output_file)
+        tasks = []
+        for output_file in WORDPRESS_TEMPLATES:
+            output_path = theme_dir / _SANITIZED_PHP_OUTPUTS[output_file]
+
+            # HARD-LOCKED TEMPLATES: Always use fallback, never render from main template
+            if output_file in HARD_LOCKED_TEMPLATES:
+                logger.info("Using hard-locked fallback template for %s (never LLM-generated)", output_file)
+                template = self._fallback_templates.get(output_file)
+                if template is None:
+                    logger.error("CRITICAL: Hard-locked template %s has no fallback", output_file)
+                    raise ValueError(f"Hard-locked template {output_file} failed: no fallback template")
+            else:
+                # REGULAR TEMPLATES: Render main template, fall back if validation fails
+                template = self._php_templates[output_file]
+
+            tasks.append((output_file, output_path, template))
+
+        php_outputs = {
+            output_file: output_path
+            for output_file, output_path, _ in tasks
+            if output_file.endswith('.php')
+        }
+
+        # assets/js/ already exists (see THEME_SUBDIRECTORIES)
+        for output_file, template in self._js_templates.items():
+            tasks.append((output_file, theme_dir / output_file, template))
+
+        self._render_all(tasks, context)
 
-                # HARD-LOCKED TEMPLATES: Always use fallback, never render from main template
+        # Validate ALL PHP files (not just critical ones)
+        validation = validate_php_files(list(php_outputs.values()))
+
+        fallback_outputs: dict[str, Path] = {}
+        for output_file, output_path in php_outputs.items():
+            if validation[output_path]:
+                continue
+
+            try:
                 if output_file in HARD_LOCKED_TEMPLATES:
-                    logger.info(f"Using hard-locked fallback template for {output_file} (never LLM-generated)")
-                    try:
-                        fallback_template = self.fallback_env.get_template(template_file)
-                        content = fallback_template.render(**context)
-                        output_path.write_text(content, encoding="utf-8")
-
-                        # Validate the hard-locked template
-                        if output_file.endswith('.php'):
-                            if not validate_php_file(output_path):
-                                logger.error(f"CRITICAL: Hard-locked fallback template {output_file} failed validation")
-                                raise ValueError(f"Hard-locked fallback template {output_file} is invalid")
-
-                        logger.debug(f"Rendered hard-locked: {output_file}")
-                        continue
-                    except Exception as e:
-                        logger.error(f"CRITICAL: Failed to render hard-locked template {output_file}: {e}")
-                        raise ValueError(f"Hard-locked template {output_file} failed: {e}")
-
-                # REGULAR TEMPLATES: Try main template, fall back if validation fails
-                template = self.php_env.get_template(template_file)
-                content = template.render(**context)
-                output_path.write_text(content, encoding="utf-8")
-
-                logger.debug(f"Rendered: {output_file}")
-
-                # Validate ALL PHP files (not just critical ones)
-                if output_file.endswith('.php'):
-                    is_valid = validate_php_file(output_path)
-
-                    if not is_valid:
-                        logger.error(f"PHP validation failed for {output_file}, using fallback template")
-
-                        # ALWAYS use fallback template, NEVER generate stubs
-                        try:
-                            fallback_template = self.fallback_env.get_template(template_file)
-                            fallback_content = fallback_template.render(**context)
-                            output_path.write_text(fallback_content, encoding="utf-8")
-
-                            # Validate fallback - fallbacks MUST be valid
-                            if validate_php_file(output_path):
-                                logger.info(f"Successfully used fallback template for {output_file}")
-                            else:
-                                logger.error(f"CRITICAL: Fallback template {output_file} failed validation")
-                                raise ValueError(f"Fallback template {output_file} is invalid - this should never happen")
-
-                        except Exception as fallback_error:
-                            # If fallback fails, this is a critical error - no stubs allowed
-                            logger.error(f"CRITICAL: Failed to use fallback template for {output_file}: {fallback_error}")
-                            raise ValueError(f"Cannot generate valid {output_file} - fallback failed: {fallback_error}")
+                    logger.error("CRITICAL: Hard-locked fallback template %s failed validation", output_file)
+                    raise ValueError(f"Hard-locked fallback template {output_file} is invalid")
+
+                logger.error("PHP validation failed for %s, using fallback template", output_file)
+
+                # ALWAYS use fallback template, NEVER generate stubs
+                try:
+                    self._get_fallback_template(output_file).stream(context).dump(
+                        str(output_path), encoding="utf-8"
+                    )
+                except Exception as fallback_error:
+                    # If fallback fails, this is a critical error - no stubs allowed
+                    logger.error("CRITICAL: Failed to use fallback template for %s: %s", output_file, fallback_error)
+                    raise ValueError(f"Cannot generate valid {output_file} - fallback failed: {fallback_error}")
 
             except Exception as e:
-                logger.error(f"Failed to render {output_file}: {e}")
+                logger.error("Failed to render %s: %s", output_file, e)
                 raise ValueError(f"Template rendering failed for {output_file}: {e}")
 
+            fallback_outputs[output_file] = output_path
+
+        # Validate fallbacks in one batch as well - fallbacks MUST be valid
+        fallback_validation = validate_php_files(list(fallback_outputs.values()))
+
+        for output_file, output_path in fallback_outputs.items():
+            if fallback_validation[output_path]:
+                logger.info("Successfully used fallback template for %s", output_file)
+                continue
+
+            logger.error("CRITICAL: Fallback template %s failed validation", output_file)
+            raise ValueError(
+                f"Template rendering failed for {output_file}: Cannot generate valid {output_file} - "
+                f"fallback failed: Fallback template {output_file} is invalid - this should never happen"
+            )
+
         # ENFORCEMENT: Verify all required templates were generated
         self._verify_required_templates(theme_dir)
 
-    def _render_js_templates(self, theme_dir: Path, context: dict[str, Any]) -> None:
-        """Render JavaScript templates.
+    def _render_all(self, tasks: list[tuple[str, Path, Template]], context: dict[str, Any]) -> None:
+        """Render templates to their output files on a thread pool.
+
+        Each task writes a different file, so the writes overlap.
 
         Args:
-            theme_dir: Theme directory path
+            tasks: (output_file, output_path, template) tuples
             context: Template context
+
+        Raises:
+            ValueError: If any template fails to render
         """
-        for output_file, template_file in JS_TEMPLATES.items():
-            try:
-                template = self.js_env.get_template(template_file)
-                content = template.render(**context)
+        with ThreadPoolExecutor(max_workers=min(_RENDER_WORKERS, len(tasks) or 1)) as executor:
+            # Iterating the results re-raises the first failure
+            list(executor.map(lambda task: self._render_one(task, context), tasks))
 
-                # Create output path
-                output_path = theme_dir / output_file
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_text(content, encoding="utf-8")
+    def _render_one(self, task: tuple[str, Path, Template], context: dict[str, Any]) -> None:
+        """Render one template and stream it to its output file.
 
-                logger.debug(f"Rendered: {output_file}")
+        Args:
+            task: (output_file, output_path, template) tuple
+            context: Template context
 
-            except Exception as e:
-                logger.error(f"Failed to render {output_file}: {e}")
-                raise ValueError(f"Template rendering failed for {output_file}: {e}")
+        Raises:
+            ValueError: If the template fails to render
+        """
+        output_file, output_path, template = task
+        try:
+            template.stream(context).dump(str(output_path), encoding="utf-8")
+        except Exception as e:
+            if output_file in HARD_LOCKED_TEMPLATES:
+                logger.error("CRITICAL: Failed to render hard-locked template %s: %s", output_file, e)
+            else:
+                logger.error("Failed to render %s: %s", output_file, e)
+            raise ValueError(f"Template rendering failed for {output_file}: {e}")
+
+        logger.debug("Rendered: %s", output_file)
+
+    def _get_fallback_template(self, output_file: str) -> Template:
+        """Return the precompiled fallback template for an output file.
+
+        Args:
+            output_file: Key from WORDPRESS_TEMPLATES
+
+        Returns:
+            Compiled fallback template
+
+        Raises:
+            TemplateNotFound: If no fallback template exists for the file
+        """
+        template = self._fallback_templates.get(output_file)
+        if template is None:
+            raise TemplateNotFound(WORDPRESS_TEMPLATES[output_file])
+        return template
 
     def _verify_required_templates(self, theme_dir: Path) -> None:
         """Verify that all required WordPress templates are present.
@@ -440,10 +1062,10 @@ class ThemeRenderer:
         missing_templates = []
 
         for required_file in REQUIRED_TEMPLATES:
-            file_path = theme_dir / sanitize_filename(required_file)
+            file_path = theme_dir / _SANITIZED_PHP_OUTPUTS[required_file]
             if not file_path.exists():
                 missing_templates.append(required_file)
-                logger.error(f"CRITICAL: Required template {required_file} is missing")
+                logger.error("CRITICAL: Required template %s is missing", required_file)
 
         if missing_templates:
             error_msg = (
@@ -455,7 +1077,7 @@ class ThemeRenderer:
 
         # Verify no stub/placeholder files exist
         for required_file in REQUIRED_TEMPLATES:
-            file_path = theme_dir / sanitize_filename(required_file)
+            file_path = theme_dir / _SANITIZED_PHP_OUTPUTS[required_file]
             if file_path.exists():
                 content = file_path.read_text(encoding="utf-8")
                 # Check for stub indicators
@@ -467,7 +1089,7 @@ class ThemeRenderer:
                     logger.error(error_msg)
                     raise ValueError(error_msg)
 
-        logger.info(f"Verified all {len(REQUIRED_TEMPLATES)} required templates are present and non-stub")
+        logger.info("Verified all %s required templates are present and non-stub", len(REQUIRED_TEMPLATES))
 
     def _generate_additional_files(self, theme_dir: Path, spec: ThemeSpecification) -> None:
         """Generate additional theme files.
@@ -477,72 +1099,15 @@ class ThemeRenderer:
             spec: Theme specification
         """
         # Generate README.md
-        readme_content = f"""# {spec.theme_display_name}
-
-{spec.description}
-
-## Requirements
-
-- WordPress 6.0 or higher
-- PHP 7.4 or higher
-
-## Installation
-
-1. Download the theme
-2. Upload to `/wp-content/themes/`
-3. Activate in WordPress Admin > Appearance > Themes
-
-## Features
-
-- Responsive design
-- Custom color scheme
-- Widget areas
-- Navigation menus
-{"- WooCommerce support" if spec.features.woocommerce.enabled else ""}
-{"- Dark mode support" if spec.features.dark_mode else ""}
-
-## Credits
-
-Generated by [WPGen](https://github.com/wpgen/wpgen)
-
-## License
-
-GPL-2.0-or-later
-"""
-        (theme_dir / "README.md").write_text(readme_content, encoding="utf-8")
+        self._readme_template.stream({"spec": spec}).dump(
+            str(theme_dir / "README.md"), encoding="utf-8"
+        )
 
         # Generate .gitignore
-        gitignore_content = """# IDE
-.idea/
-.vscode/
-*.swp
-*.swo
-
-# OS
-.DS_Store
-Thumbs.db
-
-# Node
-node_modules/
-
-# Build
-dist/
-build/
-
-# Logs
-*.log
-"""
-        (theme_dir / ".gitignore").write_text(gitignore_content, encoding="utf-8")
+        _write_bytes_fast(theme_dir / ".gitignore", _GITIGNORE_BYTES)
 
         # Generate editor-style.css (placeholder)
-        editor_style = """/* Editor styles for Gutenberg blocks */
-.editor-styles-wrapper {
-    font-family: inherit;
-}
-"""
-        (theme_dir / "assets" / "css" / "editor-style.css").write_text(
-            editor_style, encoding="utf-8"
-        )
+        _write_bytes_fast(theme_dir / "assets" / "css" / "editor-style.css", _EDITOR_STYLE_BYTES)
 
     def _generate_screenshot(
         self,
@@ -559,14 +1124,44 @@ build/
         """
         screenshot_path = theme_dir / "screenshot.png"
 
-        if screenshot_path.exists():
+        # Claim the file up front: an existing screenshot is kept, and the
+        # O_EXCL open doubles as the existence check
+        try:
+            fd = os.open(screenshot_path, _EXCLUSIVE_WRITE_FLAGS, 0o644)
+        except FileExistsError:
             return
 
+        data = None
+        try:
+            data = self._screenshot_png(spec, images)
+            if data is not None:
+                _write_all(fd, data)
+        finally:
+            os.close(fd)
+            if data is None:
+                screenshot_path.unlink(missing_ok=True)
+
+    def _screenshot_png(
+        self,
+        spec: ThemeSpecification,
+        images: list[dict[str, Any]] | None
+    ) -> bytes | None:
+        """Build the screenshot image as PNG bytes.
+
+        Args:
+            spec: Theme specification
+            images: Optional list of design reference images
+
+        Returns:
+            PNG file contents, or None if no screenshot could be produced
+        """
+        if Image is None:
+            logger.warning("PIL not installed, skipping screenshot generation")
+            return None
+
         # Try to use provided image
         if images and len(images) > 0:
             try:
-                from PIL import Image
-
                 img_data = images[0]
                 src = img_data.get('path') if isinstance(img_data, dict) else img_data
 
@@ -574,165 +1169,43 @@ build/
                     with Image.open(src) as im:
                         im = im.convert("RGB")
                         canvas = Image.new("RGB", (1200, 900), (247, 248, 250))
-                        im.thumbnail((1200, 900))
+                        im.thumbnail((1200, 900), Image.Resampling.BILINEAR, reducing_gap=2.0)
                         x = (1200 - im.width) // 2
                         y = (900 - im.height) // 2
                         canvas.paste(im, (x, y))
-                        canvas.save(screenshot_path, format="PNG", optimize=True)
+                        buffer = io.BytesIO()
+                        canvas.save(buffer, format="PNG", optimize=True)
                         logger.info("Generated screenshot from uploaded image")
-                        return
+                        return buffer.getvalue()
 
             except Exception as e:
-                logger.warning(f"Could not use uploaded image for screenshot: {e}")
+                logger.warning("Could not use uploaded image for screenshot: %s", e)
 
         # Generate placeholder screenshot
         try:
-            from PIL import Image, ImageDraw, ImageFilter, ImageFont
-
-            def _hex_to_rgb(value: str, fallback: tuple[int, int, int]) -> tuple[int, int, int]:
-                """Convert hex color to RGB tuple with graceful fallback."""
-                if not value or not isinstance(value, str) or not value.startswith("#"):
-                    return fallback
-                value = value.lstrip("#")
-                if len(value) != 6:
-                    return fallback
-                try:
-                    return tuple(int(value[i:i+2], 16) for i in (0, 2, 4))
-                except ValueError:
-                    return fallback
-
-            def _blend(color: tuple[int, int, int], other: tuple[int, int, int], ratio: float) -> tuple[int, int, int]:
-                return tuple(int(color[i] * (1 - ratio) + other[i] * ratio) for i in range(3))
-
-            primary = _hex_to_rgb(spec.colors.primary, (26, 26, 46))
-            secondary = _hex_to_rgb(spec.colors.secondary, _blend(primary, (255, 255, 255), 0.15))
-            accent = _hex_to_rgb(spec.colors.accent, _blend(primary, (255, 255, 255), 0.35))
-            background = _hex_to_rgb(spec.colors.background, (248, 250, 252))
-            surface = _hex_to_rgb(spec.colors.surface, (255, 255, 255))
-            text_primary = _hex_to_rgb(spec.colors.text_primary, (17, 24, 39))
-            text_secondary = _hex_to_rgb(spec.colors.text_secondary, (55, 65, 81))
-            border = _hex_to_rgb(spec.colors.border, (226, 232, 240))
-
-            img = Image.new("RGB", (1200, 900), background)
-            draw = ImageDraw.Draw(img)
-
-            hero_height = 360
-            hero = Image.new("RGB", (1200, hero_height))
-            hero_draw = ImageDraw.Draw(hero)
-            for y in range(hero_height):
-                ratio = y / max(hero_height - 1, 1)
-                gradient_color = _blend(primary, secondary, ratio)
-                hero_draw.line([(0, y), (1200, y)], fill=gradient_color)
-            img.paste(hero, (0, 0))
-
-            overlay = Image.new("RGBA", (1200, hero_height), (*accent, 30))
-            img.paste(overlay, (0, 0), overlay)
-
-            card_area_top = hero_height + 30
-            card_width = 320
-            card_height = 200
-            gap = 60
-            start_x = (1200 - (3 * card_width + 2 * gap)) // 2
-            shadow_color = (0, 0, 0, 60)
-
-            for i in range(3):
-                card_x = start_x + i * (card_width + gap)
-                card_y = card_area_top
-
-                shadow = Image.new("RGBA", (card_width + 20, card_height + 20), (0, 0, 0, 0))
-                shadow_draw = ImageDraw.Draw(shadow)
-                shadow_draw.rectangle([10, 10, card_width + 10, card_height + 10], fill=shadow_color)
-                shadow = shadow.filter(ImageFilter.GaussianBlur(radius=8))
-                img.paste(shadow, (card_x - 10, card_y - 6), shadow)
-
-                draw.rectangle(
-                    [card_x, card_y, card_x + card_width, card_y + card_height],
-                    fill=surface,
-                    outline=border,
-                    width=2,
-                )
-
-                draw.line(
-                    [card_x, card_y + 72, card_x + card_width, card_y + 72],
-                    fill=_blend(border, accent, 0.15),
-                    width=1,
-                )
-
-            try:
-                font_title = ImageFont.truetype("DejaVuSans-Bold.ttf", 64)
-                font_sub = ImageFont.truetype("DejaVuSans.ttf", 30)
-                font_button = ImageFont.truetype("DejaVuSans-Bold.ttf", 24)
-                font_small = ImageFont.truetype("DejaVuSans.ttf", 20)
-            except Exception:
-                font_title = ImageFont.load_default()
-                font_sub = ImageFont.load_default()
-                font_button = ImageFont.load_default()
-                font_small = ImageFont.load_default()
-
-            title = spec.theme_display_name
-            bbox = draw.textbbox((0, 0), title, font=font_title)
-            tw = bbox[2] - bbox[0]
-            draw.text(((1200 - tw) // 2, 120), title, fill=surface, font=font_title)
-
-            subtitle = f"Powered by {spec.typography.font_headings} & {spec.typography.font_primary}"
-            bbox2 = draw.textbbox((0, 0), subtitle, font=font_sub)
-            sw = bbox2[2] - bbox2[0]
-            draw.text(((1200 - sw) // 2, 200), subtitle, fill=_blend(surface, text_secondary, 0.1), font=font_sub)
-
-            cta_width = 280
-            cta_height = 64
-            cta_x = (1200 - cta_width) // 2
-            cta_y = 260
-            draw.rectangle([cta_x, cta_y, cta_x + cta_width, cta_y + cta_height], fill=accent, outline=_blend(accent, text_primary, 0.2), width=2)
-
-            cta_text = spec.hero.cta_text or "Explore the Theme"
-            bbox_cta = draw.textbbox((0, 0), cta_text, font=font_button)
-            draw.text(
-                (cta_x + (cta_width - (bbox_cta[2] - bbox_cta[0])) // 2, cta_y + (cta_height - (bbox_cta[3] - bbox_cta[1])) // 2),
-                cta_text,
-                fill=(255, 255, 255),
-                font=font_button,
-            )
-
-            secondary_cta_width = 200
-            secondary_cta_height = 54
-            secondary_cta_x = cta_x + cta_width + 24
-            secondary_cta_y = cta_y + 5
-            draw.rectangle(
-                [secondary_cta_x, secondary_cta_y, secondary_cta_x + secondary_cta_width, secondary_cta_y + secondary_cta_height],
-                fill=surface,
-                outline=border,
-                width=2,
-            )
-
-            secondary_text = spec.hero.secondary_cta_text or "View Components"
-            bbox_secondary = draw.textbbox((0, 0), secondary_text, font=font_small)
-            draw.text(
+            colors = spec.colors
+            data = _placeholder_png(
                 (
-                    secondary_cta_x + (secondary_cta_width - (bbox_secondary[2] - bbox_secondary[0])) // 2,
-                    secondary_cta_y + (secondary_cta_height - (bbox_secondary[3] - bbox_secondary[1])) // 2,
+                    colors.primary,
+                    colors.secondary,
+                    colors.accent,
+                    colors.background,
+                    colors.surface,
+                    colors.text_primary,
+                    colors.text_secondary,
+                    colors.border,
                 ),
-                secondary_text,
-                fill=text_primary,
-                font=font_small,
+                spec.theme_display_name,
+                f"Powered by {spec.typography.font_headings} & {spec.typography.font_primary}",
+                spec.hero.cta_text or "Explore the Theme",
+                spec.hero.secondary_cta_text or "View Components",
             )
-
-            caption = "Designed palette • Hero • Cards • CTA"
-            bbox_caption = draw.textbbox((0, 0), caption, font=font_small)
-            draw.text(
-                ((1200 - (bbox_caption[2] - bbox_caption[0])) // 2, card_area_top + card_height + 40),
-                caption,
-                fill=text_secondary,
-                font=font_small,
-            )
-
-            img.save(screenshot_path, format="PNG", optimize=True)
             logger.info("Generated placeholder screenshot")
+            return data
 
-        except ImportError:
-            logger.warning("PIL not installed, skipping screenshot generation")
         except Exception as e:
-            logger.warning(f"Could not generate screenshot: {e}")
+            logger.warning("Could not generate screenshot: %s", e)
+            return None
 
 
 def render_theme(
@@ -224,11 +224,12 @@ class CodeValidator:
                 logger.warning(warning_msg)
                 return True, warning_msg, True
 
-    def validate_file(self, file_path: Path) -> dict[str, Any]:
+    def validate_file(self, file_path: Path, content: str | None = None) -> dict[str, Any]:
         """Validate a single file.
 
         Args:
             file_path: Path to file to validate
+            content: File contents if already read (read from disk when None)
 
         Returns:
             Dictionary with validation results
@@ -242,7 +243,7 @@ class CodeValidator:
 
         if file_path.suffix == '.php':
             try:
-                php_code = file_path.read_text(encoding='utf-8')
+                php_code = content if content is not None else file_path.read_text(encoding='utf-8')
                 is_valid, message, is_warning = self.validate_php_syntax(php_code)
 
                 if not is_valid:
@@ -263,11 +264,15 @@ class CodeValidator:
 
         return result
 
-    def validate_directory(self, directory: str) -> dict[str, Any]:
+    def validate_directory(
+        self, directory: str, files: dict[Path, str | None] | None = None
+    ) -> dict[str, Any]:
         """Validate all PHP files in a directory.
 
         Args:
             directory: Path to directory to validate
+            files: PHP files already collected from the directory, mapped to their
+                contents (None means read from disk); scanned for when omitted
 
         Returns:
             Dictionary with aggregated validation results
@@ -289,11 +294,12 @@ class CodeValidator:
             return results
 
         # Find all PHP files
-        php_files = list(dir_path.rglob("*.php"))
-        results["files_checked"] = len(php_files)
+        if files is None:
+            files = dict.fromkeys(dir_path.rglob("*.php"))
+        results["files_checked"] = len(files)
 
-        for php_file in php_files:
-            file_result = self.validate_file(php_file)
+        for php_file, content in files.items():
+            file_result = self.validate_file(php_file, content)
             results["details"].append(file_result)
 
             if not file_result["valid"]:
@@ -0,0 +1,78 @@
+"""Single-pass theme validation.
+
+CodeValidator and ThemeValidator each walk the theme directory and read every
+PHP file. This module walks the directory once, reads each PHP file once, and
+hands the same contents to both validators.
+"""
+
+import os
+from pathlib import Path
+from typing import Any
+
+from .code_validator import CodeValidator
+from .logger import get_logger
+from .theme_validator import ThemeValidator
+
+logger = get_logger(__name__)
+
+
+def collect_php_files(theme_dir: str | Path) -> dict[Path, str | None]:
+    """Read every PHP file under a directory in one walk.
+
+    Args:
+        theme_dir: Directory to scan
+
+    Returns:
+        Mapping of PHP file path to its contents; None for files that could not
+        be read, so each validator reports the read error in its own format
+    """
+    files: dict[Path, str | None] = {}
+    for root, _, filenames in os.walk(theme_dir):
+        for filename in filenames:
+            if not filename.endswith(".php"):
+                continue
+            path = Path(root, filename)
+            try:
+                files[path] = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                logger.debug(f"Could not pre-read {path}: {e}")
+                files[path] = None
+    return files
+
+
+def validate_directory(
+    theme_dir: str | Path,
+    strict: bool = False,
+    php_path: str = "php",
+    code_validator: CodeValidator | None = None,
+    theme_validator: ThemeValidator | None = None,
+) -> dict[str, Any]:
+    """Run CodeValidator and ThemeValidator over a theme with one directory walk.
+
+    Args:
+        theme_dir: Path to the theme directory
+        strict: Whether to use strict validation
+        php_path: Path to PHP binary
+        code_validator: Preconfigured CodeValidator (built from strict/php_path if None)
+        theme_validator: Preconfigured ThemeValidator (built from strict/php_path if None)
+
+    Returns:
+        Dictionary with merged "errors" and "warnings" plus each validator's
+        full results under "code" and "theme"
+    """
+    if code_validator is None:
+        code_validator = CodeValidator(strict=strict, php_path=php_path)
+    if theme_validator is None:
+        theme_validator = ThemeValidator(strict=strict, php_path=php_path)
+
+    files = collect_php_files(theme_dir) if Path(theme_dir).is_dir() else None
+
+    code_results = code_validator.validate_directory(str(theme_dir), files)
+    theme_results = theme_validator.validate(str(theme_dir), files)
+
+    return {
+        "errors": code_results.get("errors", []) + theme_results.get("errors", []),
+        "warnings": code_results.get("warnings", []) + theme_results.get("warnings", []),
+        "code": code_results,
+        "theme": theme_results,
+    }
@@ -5,6 +5,7 @@ and preparing files for LLM multi-modal context with security hardening.
 """
 
 import base64
+import fnmatch
 import mimetypes
 import os
 import shutil
@@ -421,26 +422,27 @@ class FileHandler:
 
             excluded_count = 0
 
+            # Walk top-down so excluded and hidden directories are pruned instead
+            # of descended into (a theme's .git or node_modules can dwarf it);
+            # ZipFile streams each member to disk, so memory stays flat
             with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                for file_path in dir_path.rglob("*"):
-                    # Skip if path contains excluded directory
-                    if any(excluded_dir in file_path.parts for excluded_dir in exclude_dirs):
-                        excluded_count += 1
-                        continue
-
-                    # Skip hidden files/directories (starting with .)
-                    if any(part.startswith('.') for part in file_path.parts[len(dir_path.parts):]):
-                        excluded_count += 1
-                        continue
-
-                    # Skip files matching excluded patterns
-                    if any(file_path.match(pattern) for pattern in exclude_patterns):
-                        excluded_count += 1
-                        continue
-
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(dir_path)
-                        zipf.write(file_path, arcname)
+                for root, dirnames, filenames in os.walk(dir_path):
+                    kept = [d for d in dirnames if d not in exclude_dirs and not d.startswith('.')]
+                    excluded_count += len(dirnames) - len(kept)
+                    dirnames[:] = kept
+
+                    root_path = Path(root)
+                    for filename in filenames:
+                        # Skip hidden files and files matching excluded patterns
+                        if filename.startswith('.') or any(
+                            fnmatch.fnmatch(filename, pattern) for pattern in exclude_patterns
+                        ):
+                            excluded_count += 1
+                            continue
+
+                        file_path = root_path / filename
+                        if file_path.is_file():
+                            zipf.write(file_path, file_path.relative_to(dir_path))
 
             if excluded_count > 0:
                 logger.info(f"Excluded {excluded_count} files/directories from ZIP (.git, .github, node_modules, hidden files)")
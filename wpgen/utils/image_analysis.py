@@ -18,6 +18,49 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Longest edge vision providers accept without server-side downscaling
+MAX_VISION_DIMENSION = 1568
+
+# Formats Pillow can re-encode losslessly enough for design references
+_REENCODE_FORMATS = {"JPEG": "image/jpeg", "PNG": "image/png", "WEBP": "image/webp"}
+
+
+def prepare_image_for_vision(
+    image_data: dict[str, Any], max_dimension: int = MAX_VISION_DIMENSION
+) -> dict[str, Any]:
+    """Downscale an uploaded image so its longest edge fits the vision limit.
+
+    Images already within the limit, or that cannot be decoded, are returned
+    unchanged so the provider still receives the original upload.
+
+    Args:
+        image_data: Image data dictionary with 'data' (base64) and 'mime_type'
+        max_dimension: Maximum width or height in pixels
+
+    Returns:
+        Image data dictionary with resized 'data' and matching 'mime_type'
+    """
+    try:
+        img = Image.open(io.BytesIO(base64.b64decode(image_data["data"])))
+        if max(img.size) <= max_dimension:
+            return image_data
+
+        fmt = img.format if img.format in _REENCODE_FORMATS else "PNG"
+        if fmt == "JPEG" and img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+
+        buffer = io.BytesIO()
+        img.save(buffer, format=fmt)
+    except Exception as e:
+        logger.debug(f"Image preprocessing skipped: {str(e)}")
+        return image_data
+
+    prepared = dict(image_data)
+    prepared["data"] = base64.b64encode(buffer.getvalue()).decode("ascii")
+    prepared["mime_type"] = _REENCODE_FORMATS[fmt]
+    return prepared
+
 
 class ImageAnalyzer:
     """Analyze images for design insights and content extraction."""
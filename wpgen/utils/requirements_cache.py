@@ -0,0 +1,102 @@
+"""Persistent cache of parsed prompt requirements.
+
+Parsing a prompt into requirements costs a full LLM round trip. Identical
+prompts sent to the same provider and model produce interchangeable
+requirements, so the parsed dictionaries are stored in a small SQLite database
+and reused on later runs.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RequirementsCache:
+    """SQLite-backed exact-match cache for PromptParser results."""
+
+    def __init__(self, db_path: str | Path, ttl_seconds: int = 86400):
+        """Open (or create) the cache database.
+
+        Args:
+            db_path: Path to the SQLite database file
+            ttl_seconds: Entries older than this are treated as misses; 0 disables expiry
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, ts INTEGER)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(provider_name: str, model: str, prompt: str) -> str:
+        """Build the cache key for a prompt sent to a provider and model.
+
+        Args:
+            provider_name: LLM provider name
+            model: Model name (may be empty)
+            prompt: Prompt passed to the parser
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        return hashlib.sha256(f"{provider_name}|{model}|{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Look up cached requirements.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Requirements dictionary, or None on a miss or expired entry
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, ts FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        value, ts = row
+        if self.ttl_seconds and time.time() - ts > self.ttl_seconds:
+            return None
+
+        try:
+            return json.loads(zlib.decompress(value))
+        except (zlib.error, ValueError) as e:
+            logger.warning(f"Discarding unreadable requirements cache entry: {e}")
+            return None
+
+    def set(self, key: str, requirements: dict[str, Any]) -> None:
+        """Store requirements under a key.
+
+        Args:
+            key: Key from make_key()
+            requirements: Parsed requirements dictionary (must be JSON-serializable)
+        """
+        value = zlib.compress(json.dumps(requirements).encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                (key, value, int(time.time())),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
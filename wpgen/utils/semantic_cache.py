@@ -0,0 +1,158 @@
+"""Semantic near-match cache of parsed prompt requirements.
+
+Complements RequirementsCache: rephrased prompts ("modern streetwear site" vs
+"sleek urban fashion page") miss the exact-match cache but usually parse to
+interchangeable requirements. Prompts are embedded with a small
+sentence-transformers model and stored in the same SQLite database, and the
+nearest earlier prompt is reused when it is similar enough.
+
+Requires the optional ``sentence-transformers`` package.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Small, fast sentence embedding model (384 dimensions)
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+class SemanticRequirementsCache:
+    """Near-match cache that reuses requirements for paraphrased prompts.
+
+    Prompts are embedded with a sentence-transformers model and compared by
+    cosine similarity against earlier prompts sent to the same provider and
+    model; a hit above the threshold returns the stored requirements.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        threshold: float = 0.92,
+        ttl_seconds: int = 86400,
+        encoder: Callable[[list[str]], Any] | None = None,
+    ):
+        """Open (or create) the semantic cache tables.
+
+        Args:
+            db_path: Path to the SQLite database file
+            threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Entries older than this are ignored; 0 disables expiry
+            encoder: Callable mapping a list of texts to normalized embeddings;
+                defaults to a lazily loaded sentence-transformers model
+
+        Raises:
+            ImportError: If no encoder is given and sentence-transformers is missing
+        """
+        if encoder is None:
+            encoder = _load_default_encoder()
+
+        self.db_path = Path(db_path)
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._encoder = encoder
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS semantic_cache ("
+            "id INTEGER PRIMARY KEY, scope TEXT, embedding BLOB, value BLOB, ts INTEGER)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS semantic_cache_scope ON semantic_cache (scope)"
+        )
+        self._conn.commit()
+
+    def embed(self, prompt: str) -> np.ndarray:
+        """Embed a prompt as a unit-length float32 vector.
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            Normalized embedding
+        """
+        vector = np.asarray(self._encoder([prompt]), dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, scope: str, embedding: np.ndarray) -> dict[str, Any] | None:
+        """Find requirements stored for a sufficiently similar prompt.
+
+        Args:
+            scope: Provider/model scope, e.g. "openai|gpt-4"
+            embedding: Embedding from embed()
+
+        Returns:
+            Requirements of the most similar prompt, or None below the threshold
+        """
+        min_ts = int(time.time()) - self.ttl_seconds if self.ttl_seconds else 0
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT embedding, value FROM semantic_cache WHERE scope = ? AND ts >= ?",
+                (scope, min_ts),
+            ).fetchall()
+
+        candidates = [row for row in rows if len(row[0]) == embedding.nbytes]
+        if not candidates:
+            return None
+
+        matrix = np.frombuffer(b"".join(row[0] for row in candidates), dtype=np.float32)
+        scores = matrix.reshape(len(candidates), -1) @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        logger.debug(f"Semantic cache hit (similarity {scores[best]:.3f})")
+        try:
+            return json.loads(zlib.decompress(candidates[best][1]))
+        except (zlib.error, ValueError) as e:
+            logger.warning(f"Discarding unreadable semantic cache entry: {e}")
+            return None
+
+    def set(self, scope: str, embedding: np.ndarray, requirements: dict[str, Any]) -> None:
+        """Store requirements for a prompt embedding.
+
+        Args:
+            scope: Provider/model scope, e.g. "openai|gpt-4"
+            embedding: Embedding from embed()
+            requirements: Parsed requirements dictionary (must be JSON-serializable)
+        """
+        value = zlib.compress(json.dumps(requirements).encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO semantic_cache (scope, embedding, value, ts) VALUES (?, ?, ?, ?)",
+                (scope, embedding.astype(np.float32).tobytes(), value, int(time.time())),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _load_default_encoder() -> Callable[[list[str]], Any]:
+    """Load the default sentence-transformers encoder.
+
+    Returns:
+        Callable producing normalized embeddings
+
+    Raises:
+        ImportError: If sentence-transformers is not installed
+    """
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(DEFAULT_EMBEDDING_MODEL)
+    return lambda texts: model.encode(texts, normalize_embeddings=True)
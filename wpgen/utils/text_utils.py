@@ -73,11 +73,37 @@ class TextProcessor:
 
         return result
 
-    def _extract_from_pdf(self, path: Path) -> str:
+    def extract_text(self, file_path: str, max_chars: int = -1) -> str:
+        """Extract plain text from a file, stopping once a character budget is met.
+
+        Args:
+            file_path: Path to a PDF, Markdown or plain text file
+            max_chars: Maximum characters to return; -1 reads the whole file
+
+        Returns:
+            Extracted text, at most max_chars long (empty if the file is missing)
+        """
+        path = Path(file_path)
+        if not path.exists():
+            logger.warning(f"File not found: {file_path}")
+            return ""
+
+        if path.suffix.lower() == ".pdf":
+            content = self._extract_from_pdf(path, max_chars)
+        elif path.suffix.lower() in [".md", ".markdown"]:
+            content = self._extract_from_markdown(path, max_chars)
+        else:
+            content = self._extract_from_text(path, max_chars)
+
+        return content if max_chars < 0 else content[:max_chars]
+
+    def _extract_from_pdf(self, path: Path, max_chars: int = -1) -> str:
         """Extract text from PDF file.
 
         Args:
             path: Path to PDF file
+            max_chars: Stop parsing pages once this many characters are
+                collected; -1 parses every page
 
         Returns:
             Extracted text content
@@ -88,11 +114,15 @@ class TextProcessor:
             with open(path, "rb") as f:
                 reader = PyPDF2.PdfReader(f)
                 text_parts = []
+                collected = 0
 
                 for page_num, page in enumerate(reader.pages):
+                    if 0 <= max_chars <= collected:
+                        break
                     text = page.extract_text()
                     if text:
                         text_parts.append(f"--- Page {page_num + 1} ---\n{text}")
+                        collected += len(text_parts[-1]) + 2
 
                 content = "\n\n".join(text_parts)
                 return content.strip()
@@ -104,34 +134,36 @@ class TextProcessor:
             logger.error(f"PDF extraction error: {str(e)}")
             return f"[PDF file: {path.name} - extraction failed: {str(e)}]"
 
-    def _extract_from_markdown(self, path: Path) -> str:
+    def _extract_from_markdown(self, path: Path, max_chars: int = -1) -> str:
         """Extract text from Markdown file.
 
         Args:
             path: Path to markdown file
+            max_chars: Maximum characters to read; -1 reads the whole file
 
         Returns:
             Markdown content
         """
         try:
-            content = path.read_text(encoding="utf-8")
-            return content
+            with open(path, encoding="utf-8") as f:
+                return f.read(max_chars)
         except Exception as e:
             logger.error(f"Markdown extraction error: {str(e)}")
             return ""
 
-    def _extract_from_text(self, path: Path) -> str:
+    def _extract_from_text(self, path: Path, max_chars: int = -1) -> str:
         """Extract text from plain text file.
 
         Args:
             path: Path to text file
+            max_chars: Maximum characters to read; -1 reads the whole file
 
         Returns:
             Text content
         """
         try:
-            content = path.read_text(encoding="utf-8")
-            return content
+            with open(path, encoding="utf-8") as f:
+                return f.read(max_chars)
         except Exception as e:
             logger.error(f"Text extraction error: {str(e)}")
             return ""
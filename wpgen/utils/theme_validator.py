@@ -42,11 +42,15 @@ class ThemeValidator:
         except (FileNotFoundError, subprocess.TimeoutExpired):
             return False
 
-    def validate(self, theme_path: str) -> dict[str, any]:
+    def validate(
+        self, theme_path: str, files: dict[Path, str | None] | None = None
+    ) -> dict[str, any]:
         """Validate a WordPress theme directory.
 
         Args:
             theme_path: Path to the theme directory
+            files: PHP files already collected from the theme, mapped to their
+                contents (None means read from disk); scanned for when omitted
 
         Returns:
             Dictionary with validation results
@@ -103,12 +107,13 @@ class ThemeValidator:
                 return results
 
         # Validate all PHP files
-        php_files = list(theme_dir.rglob("*.php"))
-        results["php_files"] = len(php_files)
+        if files is None:
+            files = dict.fromkeys(theme_dir.rglob("*.php"))
+        results["php_files"] = len(files)
 
-        for php_file in php_files:
+        for php_file, content in files.items():
             results["total_files"] += 1
-            file_result = self._validate_php_file(php_file, theme_dir)
+            file_result = self._validate_php_file(php_file, theme_dir, content)
 
             if file_result.get("errors"):
                 results["invalid_files"] += 1
@@ -127,12 +132,15 @@ class ThemeValidator:
 
         return results
 
-    def _validate_php_file(self, php_file: Path, theme_dir: Path) -> dict[str, any]:
+    def _validate_php_file(
+        self, php_file: Path, theme_dir: Path, content: str | None = None
+    ) -> dict[str, any]:
         """Validate a single PHP file.
 
         Args:
             php_file: Path to PHP file
             theme_dir: Path to theme directory (for relative paths)
+            content: File contents if already read (read from disk when None)
 
         Returns:
             Dictionary with file validation results
@@ -145,7 +153,8 @@ class ThemeValidator:
 
         # Read file content
         try:
-            content = php_file.read_text(encoding="utf-8")
+            if content is None:
+                content = php_file.read_text(encoding="utf-8")
         except Exception as e:
             result["errors"].append(f"Cannot read file: {str(e)}")
             return result
@@ -8,10 +8,12 @@ This module provides complete WordPress site control via REST API, enabling:
 """
 
 import logging
+import unicodedata
 import zipfile
 from base64 import b64encode
 from pathlib import Path
 from typing import Any
+from urllib.parse import quote
 
 import requests
 from tenacity import (
@@ -28,6 +30,32 @@ from ..utils.http_errors import handle_http_error
 logger = get_logger(__name__)
 
 
+def _content_disposition(filename: str) -> str:
+    """Build an attachment Content-Disposition header for an upload.
+
+    The quoted filename= parameter is always ASCII so http.client can send it;
+    names that lose characters in that form also carry the exact UTF-8 name in
+    an RFC 5987 filename*= parameter.
+
+    Args:
+        filename: Name of the uploaded file
+
+    Returns:
+        Content-Disposition header value
+    """
+    normalized = unicodedata.normalize("NFKD", filename)
+    fallback = "".join(
+        char if 32 <= ord(char) < 127 else "_"
+        for char in normalized
+        if not unicodedata.combining(char)
+    )
+    escaped = fallback.replace("\\", "\\\\").replace('"', '\\"')
+    header = f'attachment; filename="{escaped}"'
+    if fallback != filename:
+        header += f"; filename*=UTF-8''{quote(filename, safe='')}"
+    return header
+
+
 def is_retryable_error(exception):
     """Check if an HTTP error is retryable."""
     if isinstance(exception, requests.exceptions.HTTPError):
@@ -514,17 +542,18 @@ class WordPressAPI:
             }
             mime_type = mime_types.get(file_path.suffix.lower(), "application/octet-stream")
 
-            # Upload file
+            # Upload file as a raw body: requests streams an open file in chunks
+            # (Content-Length from fstat), whereas a multipart files= upload
+            # builds the whole encoded body in memory first
             with open(file_path, "rb") as f:
-                files = {"file": (file_path.name, f, mime_type)}
-
                 headers = self.headers.copy()
-                headers.pop("Content-Type")  # Let requests set it for multipart
+                headers["Content-Type"] = mime_type
+                headers["Content-Disposition"] = _content_disposition(file_path.name)
 
                 response = requests.post(
                     f"{self.api_url}/media",
                     headers=headers,
-                    files=files,
+                    data=f,
                     verify=self.verify_ssl,
                     timeout=self.timeout,
                 )